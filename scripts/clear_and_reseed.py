@@ -3,10 +3,11 @@
 
 import asyncio
 import sys
+import traceback
 
 from sqlalchemy import text
 
-from nunzio.database.connection import db_manager
+from nunzio.database.connection import db_manager, managed_db
 from scripts.seed_exercises import create_sample_exercises
 
 
@@ -15,26 +16,28 @@ async def clear_and_reseed():
     print("Clearing existing data...")
 
     try:
-        await db_manager.initialize()
-
-        async with db_manager.get_session() as session:
-            await session.execute(text("DELETE FROM workout_sets"))
-            await session.execute(text("DELETE FROM exercises"))
-            await session.commit()
-            print("Cleared all data.")
-
-        # db_manager is still initialized; seed script will reuse it
-        await db_manager.close()
-        return await create_sample_exercises()
+        async with managed_db():
+            async with db_manager.get_session() as session:
+                # TRUNCATE drops and recreates the tablespace instead of logging a
+                # row-by-row DELETE. MySQL refuses to truncate a table referenced by
+                # a foreign key (exercises), so checks are off for the duration.
+                # TRUNCATE commits implicitly.
+                await session.execute(text("SET FOREIGN_KEY_CHECKS=0"))
+                try:
+                    for table in ("workout_sets", "exercises"):
+                        await session.execute(text(f"TRUNCATE TABLE {table}"))
+                finally:
+                    await session.execute(text("SET FOREIGN_KEY_CHECKS=1"))
+                print("Cleared all data.")
+
+            # db_manager is still initialized; the seed reuses its pool and
+            # managed_db closes it once, on the way out.
+            return await create_sample_exercises()
 
     except Exception as e:
         print(f"Failed to clear and reseed: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
-    finally:
-        await db_manager.close()
 
 
 if __name__ == "__main__":
@@ -9,129 +9,163 @@ Each old session_id becomes a batch_id (1-based, ordered by session date).
 
 import asyncio
 import sys
+import traceback
 
 from sqlalchemy import text
-
-from nunzio.database.connection import db_manager
+from sqlalchemy.exc import DBAPIError
+
+from nunzio.database.connection import db_manager, managed_db
+from nunzio.database.migrations import (
+    migration_applied,
+    record_migration,
+    table_columns,
+    table_foreign_keys,
+    table_indexes,
+)
+
+# MySQL error codes meaning "this ALTER can't run with ALGORITHM=INSTANT":
+# ER_UNKNOWN_ALTER_ALGORITHM (pre-8.0 server), ER_ALTER_OPERATION_NOT_SUPPORTED,
+# and ER_ALTER_OPERATION_NOT_SUPPORTED_REASON.
+_INSTANT_UNSUPPORTED = frozenset({1800, 1845, 1846})
+
+
+async def _alter_fast(session, ddl: str) -> None:
+    """Run an ALTER with ALGORITHM=INSTANT, retrying with the server's default
+    algorithm when INSTANT isn't supported (older MySQL, or a clause like a
+    non-constant default that needs a rebuild)."""
+    try:
+        await session.execute(text(f"{ddl}, ALGORITHM=INSTANT"))
+    except DBAPIError as e:
+        code = e.orig.args[0] if e.orig is not None and e.orig.args else None
+        if code not in _INSTANT_UNSUPPORTED:
+            raise
+        await session.execute(text(ddl))
 
 
 async def migrate():
     print("Running v0.5 migration: flatten data model...")
 
     try:
-        await db_manager.initialize()
-
-        async with db_manager.get_session() as session:
-            # 1. Add new columns (idempotent)
-            for col, col_def in [
-                ("user_id", "BIGINT NOT NULL DEFAULT 0"),
-                ("set_date", "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP"),
-                ("batch_id", "INTEGER NOT NULL DEFAULT 0"),
-            ]:
-                try:
-                    await session.execute(text(
-                        f"ALTER TABLE workout_sets ADD COLUMN {col} {col_def}"
-                    ))
-                    print(f"  Added {col} column")
-                except Exception as e:
-                    if "Duplicate column" in str(e):
+        async with managed_db():
+            async with db_manager.get_session() as session:
+                if await migration_applied(session, "0.5"):
+                    print("  Already applied — nothing to do.")
+                    return True
+
+                # Introspect once; every "already done?" decision below is a set lookup.
+                columns = await table_columns(session, "workout_sets")
+                indexes = await table_indexes(session, "workout_sets")
+                foreign_keys = await table_foreign_keys(session, "workout_sets")
+
+                # 1. Add new columns (idempotent). One ALTER so the table is touched
+                #    once; INSTANT makes it metadata-only on MySQL 8.0.29+.
+                new_columns = [
+                    ("user_id", "BIGINT NOT NULL DEFAULT 0"),
+                    ("set_date", "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP"),
+                    ("batch_id", "INTEGER NOT NULL DEFAULT 0"),
+                ]
+                missing_columns = []
+                for col, col_def in new_columns:
+                    if col in columns:
                         print(f"  {col} column already exists — skipping")
                     else:
-                        raise
-
-            # 2. Backfill from workout_sessions
-            await session.execute(text("""
-                UPDATE workout_sets ws
-                JOIN workout_sessions s ON ws.session_id = s.id
-                SET ws.user_id = s.user_id,
-                    ws.set_date = s.date
-            """))
-            print("  Backfilled user_id and set_date from workout_sessions")
-
-            # 3. Assign batch_ids: each distinct session_id becomes a batch_id,
-            #    numbered per-user in chronological order
-            await session.execute(text("""
-                UPDATE workout_sets ws
-                JOIN (
-                    SELECT ws2.session_id,
-                           ROW_NUMBER() OVER (
-                               PARTITION BY s2.user_id
-                               ORDER BY s2.date, s2.id
-                           ) AS new_batch_id
-                    FROM (SELECT DISTINCT session_id FROM workout_sets) ws2
-                    JOIN workout_sessions s2 ON ws2.session_id = s2.id
-                ) mapping ON ws.session_id = mapping.session_id
-                SET ws.batch_id = mapping.new_batch_id
-            """))
-            print("  Assigned batch_ids from session ordering")
-
-            # 4. Add indexes
-            for idx_name, idx_cols in [
-                ("idx_workout_sets_user_id", "user_id"),
-                ("idx_workout_sets_batch_id", "batch_id"),
-                ("idx_workout_sets_set_date", "set_date"),
-                ("idx_workout_sets_user_batch", "user_id, batch_id"),
-            ]:
-                try:
-                    await session.execute(text(
-                        f"CREATE INDEX {idx_name} ON workout_sets ({idx_cols})"
-                    ))
-                    print(f"  Created index {idx_name}")
-                except Exception as e:
-                    if "Duplicate key name" in str(e):
+                        missing_columns.append((col, col_def))
+                if missing_columns:
+                    add_clauses = ", ".join(
+                        f"ADD COLUMN {col} {col_def}" for col, col_def in missing_columns
+                    )
+                    await _alter_fast(session, f"ALTER TABLE workout_sets {add_clauses}")
+                    print(f"  Added {', '.join(col for col, _ in missing_columns)} columns")
+
+                has_session_id = "session_id" in columns
+
+                # 2. Backfill user_id and set_date from workout_sessions and assign
+                #    batch_ids in the same pass over workout_sets. Each session becomes
+                #    a batch_id, numbered per-user in chronological order. Numbering
+                #    straight off workout_sessions avoids a DISTINCT temp table over
+                #    workout_sets; sessions with no sets just leave an unused number.
+                if has_session_id:
+                    await session.execute(text("""
+                        UPDATE workout_sets ws
+                        JOIN workout_sessions s ON ws.session_id = s.id
+                        JOIN (
+                            SELECT id,
+                                   ROW_NUMBER() OVER (
+                                       PARTITION BY user_id
+                                       ORDER BY date, id
+                                   ) AS new_batch_id
+                            FROM workout_sessions
+                        ) mapping ON mapping.id = s.id
+                        SET ws.user_id = s.user_id,
+                            ws.set_date = s.date,
+                            ws.batch_id = mapping.new_batch_id
+                    """))
+                    print("  Backfilled user_id, set_date, and batch_id from workout_sessions")
+                else:
+                    print("  session_id already removed — skipping backfill")
+
+                # 3. Add indexes — all missing ones in one ALTER so they're built in a
+                #    single table pass. No standalone user_id index: user_id-only
+                #    lookups use the (user_id, batch_id) prefix.
+                new_indexes = [
+                    ("idx_workout_sets_batch_id", "batch_id"),
+                    ("idx_workout_sets_set_date", "set_date"),
+                    ("idx_workout_sets_user_batch", "user_id, batch_id"),
+                ]
+                missing_indexes = []
+                for idx_name, idx_cols in new_indexes:
+                    if idx_name in indexes:
                         print(f"  Index {idx_name} already exists — skipping")
                     else:
-                        raise
-
-            # 5. Drop session_id FK and column
-            try:
-                # Find and drop the FK constraint
-                fk_result = await session.execute(text("""
-                    SELECT CONSTRAINT_NAME
-                    FROM information_schema.KEY_COLUMN_USAGE
-                    WHERE TABLE_NAME = 'workout_sets'
-                      AND COLUMN_NAME = 'session_id'
-                      AND REFERENCED_TABLE_NAME = 'workout_sessions'
-                """))
-                fk_rows = fk_result.fetchall()
-                for row in fk_rows:
+                        missing_indexes.append((idx_name, idx_cols))
+                if missing_indexes:
+                    index_clauses = ", ".join(
+                        f"ADD INDEX {idx_name} ({idx_cols})"
+                        for idx_name, idx_cols in missing_indexes
+                    )
+                    await session.execute(text(f"ALTER TABLE workout_sets {index_clauses}"))
+                    print(f"  Created indexes {', '.join(name for name, _ in missing_indexes)}")
+
+                # 4. Drop session_id FK, its indexes, and the column. Everything is
+                #    folded into one ALTER: a single round-trip and table pass. (Running
+                #    the drops concurrently wouldn't help — DDL on one table serializes
+                #    on its metadata lock.)
+                if has_session_id:
+                    fks = [fk for fk, col in foreign_keys.items() if col == "session_id"]
+                    old_indexes = [
+                        idx
+                        for idx in ("idx_workout_sets_session", "idx_workout_sets_session_exercise")
+                        if idx in indexes
+                    ]
+                    drop_clauses = (
+                        [f"DROP FOREIGN KEY {fk}" for fk in fks]
+                        + [f"DROP INDEX {idx}" for idx in old_indexes]
+                        + ["DROP COLUMN session_id"]
+                    )
                     await session.execute(text(
-                        f"ALTER TABLE workout_sets DROP FOREIGN KEY {row[0]}"
+                        f"ALTER TABLE workout_sets {', '.join(drop_clauses)}"
                     ))
-                    print(f"  Dropped FK {row[0]}")
-
-                # Drop old indexes that reference session_id
-                for idx in ["idx_workout_sets_session", "idx_workout_sets_session_exercise"]:
-                    try:
-                        await session.execute(text(f"DROP INDEX {idx} ON workout_sets"))
+                    for fk in fks:
+                        print(f"  Dropped FK {fk}")
+                    for idx in old_indexes:
                         print(f"  Dropped index {idx}")
-                    except Exception:
-                        pass
-
-                await session.execute(text(
-                    "ALTER TABLE workout_sets DROP COLUMN session_id"
-                ))
-                print("  Dropped session_id column")
-            except Exception as e:
-                if "check that column" in str(e).lower() or "Unknown column" in str(e):
-                    print("  session_id column already removed — skipping")
+                    print("  Dropped session_id column")
                 else:
-                    raise
+                    print("  session_id column already removed — skipping")
+
+                # 5. Drop workout_sessions table
+                await session.execute(text("DROP TABLE IF EXISTS workout_sessions"))
+                print("  Dropped workout_sessions table")
 
-            # 6. Drop workout_sessions table
-            await session.execute(text("DROP TABLE IF EXISTS workout_sessions"))
-            print("  Dropped workout_sessions table")
+                await record_migration(session, "0.5")
 
-        print("v0.5 migration complete!")
-        return True
+            print("v0.5 migration complete!")
+            return True
 
     except Exception as e:
         print(f"Migration failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
-    finally:
-        await db_manager.close()
 
 
 if __name__ == "__main__":
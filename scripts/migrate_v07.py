@@ -8,8 +8,9 @@ drops or alters existing tables.
 
 import asyncio
 import sys
+import traceback
 
-from nunzio.database.connection import db_manager
+from nunzio.database.connection import db_manager, managed_db
 from nunzio.database.models import UserSettings
 
 
@@ -17,26 +18,22 @@ async def migrate():
     print("Running v0.7 migration: add user_settings table...")
 
     try:
-        await db_manager.initialize()
-
-        # checkfirst=True → CREATE TABLE IF NOT EXISTS semantics; existing tables
-        # are left untouched.
-        async with db_manager._engine.begin() as conn:
-            await conn.run_sync(
-                UserSettings.__table__.create, checkfirst=True
-            )
-
-        print("  user_settings table is present.")
-        print("v0.7 migration complete!")
-        return True
+        async with managed_db():
+            # checkfirst=True → CREATE TABLE IF NOT EXISTS semantics; existing tables
+            # are left untouched.
+            async with db_manager._engine.begin() as conn:
+                await conn.run_sync(
+                    UserSettings.__table__.create, checkfirst=True
+                )
+
+            print("  user_settings table is present.")
+            print("v0.7 migration complete!")
+            return True
 
     except Exception as e:
         print(f"Migration failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
-    finally:
-        await db_manager.close()
 
 
 if __name__ == "__main__":
@@ -8,8 +8,9 @@ existing tables.
 
 import asyncio
 import sys
+import traceback
 
-from nunzio.database.connection import db_manager
+from nunzio.database.connection import db_manager, managed_db
 from nunzio.database.models import ProactiveLog
 
 
@@ -17,24 +18,20 @@ async def migrate():
     print("Running v0.8 migration: add proactive_log table...")
 
     try:
-        await db_manager.initialize()
+        async with managed_db():
+            # checkfirst=True → CREATE TABLE IF NOT EXISTS semantics; existing tables
+            # are left untouched.
+            async with db_manager._engine.begin() as conn:
+                await conn.run_sync(ProactiveLog.__table__.create, checkfirst=True)
 
-        # checkfirst=True → CREATE TABLE IF NOT EXISTS semantics; existing tables
-        # are left untouched.
-        async with db_manager._engine.begin() as conn:
-            await conn.run_sync(ProactiveLog.__table__.create, checkfirst=True)
-
-        print("  proactive_log table is present.")
-        print("v0.8 migration complete!")
-        return True
+            print("  proactive_log table is present.")
+            print("v0.8 migration complete!")
+            return True
 
     except Exception as e:
         print(f"Migration failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
-    finally:
-        await db_manager.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""v0.9 migration: per-user workout_sets indexes.
+
+Adds (user_id, set_date) and (user_id, exercise_id, set_date) so the stats,
+history and log-comment queries read a per-user index range instead of
+filtering the whole table, and drops idx_workout_sets_user_id, which the
+(user_id, batch_id) index already covers.
+
+Idempotent — indexes are introspected once and only the missing changes run,
+and a completed run is recorded in schema_migrations. InnoDB adds and drops
+secondary indexes online, so it is safe to run against a live database.
+"""
+
+import asyncio
+import sys
+import traceback
+
+from sqlalchemy import text
+
+from nunzio.database.connection import db_manager, managed_db
+from nunzio.database.migrations import (
+    migration_applied,
+    record_migration,
+    table_indexes,
+)
+from nunzio.database.models import WorkoutSet
+
+_NEW_INDEXES = ("idx_workout_sets_user_date", "idx_workout_sets_user_exercise_date")
+_DROPPED_INDEXES = ("idx_workout_sets_user_id",)
+
+
+async def migrate():
+    print("Running v0.9 migration: workout_sets indexes...")
+
+    try:
+        async with managed_db():
+            async with db_manager.get_session() as session:
+                if await migration_applied(session, "0.9"):
+                    print("  Already applied — nothing to do.")
+                    return True
+
+                existing = await table_indexes(session, "workout_sets")
+
+                clauses: list[str] = []
+                for idx in WorkoutSet.__table__.indexes:
+                    if idx.name in _NEW_INDEXES and idx.name not in existing:
+                        cols = ", ".join(c.name for c in idx.columns)
+                        clauses.append(f"ADD INDEX {idx.name} ({cols})")
+                        print(f"  Adding {idx.name}.")
+                for name in _DROPPED_INDEXES:
+                    if name in existing:
+                        clauses.append(f"DROP INDEX {name}")
+                        print(f"  Dropping {name}.")
+
+                # One ALTER so the table is only touched once.
+                if clauses:
+                    await session.execute(
+                        text(f"ALTER TABLE workout_sets {', '.join(clauses)}")
+                    )
+                else:
+                    print("  Indexes already match the model.")
+
+                await record_migration(session, "0.9")
+
+            print("v0.9 migration complete!")
+            return True
+
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = asyncio.run(migrate())
+    sys.exit(0 if success else 1)
@@ -3,11 +3,14 @@
 
 import asyncio
 import sys
+import traceback
 
-from nunzio.database.connection import db_manager
+from sqlalchemy.exc import IntegrityError
+
+from nunzio.database.connection import db_manager, managed_db
 from nunzio.database.repository import training_principle_repo
 
-TRAINING_PRINCIPLES = [
+TRAINING_PRINCIPLES = (
     {
         "category": "progression",
         "title": "Linear Progression",
@@ -107,7 +110,7 @@ TRAINING_PRINCIPLES = [
         ),
         "priority": 9,
     },
-]
+)
 
 
 async def seed_principles():
@@ -115,34 +118,42 @@ async def seed_principles():
     print("Seeding training principles...")
 
     try:
-        await db_manager.initialize()
-
-        async with db_manager.get_session() as session:
-            existing = await training_principle_repo.get_multi(session, limit=1)
-            if existing:
-                print("Training principles already exist. Skipping.")
-                return True
+        async with managed_db():
+            async with db_manager.get_session() as session:
+                existing = await training_principle_repo.get_multi(session, limit=1)
+                if existing:
+                    print("Training principles already exist. Skipping.")
+                    return True
 
-            created = 0
-            for data in TRAINING_PRINCIPLES:
                 try:
-                    principle = await training_principle_repo.create(session, obj_in=data)
-                    created += 1
-                    print(f"  Created: [{principle.category}] {principle.title}")
-                except Exception as e:
-                    print(f"  Failed: {data['title']}: {e}")
+                    async with session.begin_nested():
+                        await training_principle_repo.bulk_create(
+                            session, TRAINING_PRINCIPLES
+                        )
+                    created = len(TRAINING_PRINCIPLES)
+                    for data in TRAINING_PRINCIPLES:
+                        print(f"  Created: [{data['category']}] {data['title']}")
+                except IntegrityError:
+                    # Fall back to row-by-row so one bad row doesn't sink the rest
+                    created = 0
+                    for data in TRAINING_PRINCIPLES:
+                        try:
+                            async with session.begin_nested():
+                                principle = await training_principle_repo.create(
+                                    session, obj_in=data
+                                )
+                            created += 1
+                            print(f"  Created: [{principle.category}] {principle.title}")
+                        except Exception as e:
+                            print(f"  Failed: {data['title']}: {e}")
 
-            print(f"Created {created} training principles.")
-            return True
+                print(f"Created {created} training principles.")
+                return True
 
     except Exception as e:
         print(f"Failed to seed training principles: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
-    finally:
-        await db_manager.close()
 
 
 if __name__ == "__main__":
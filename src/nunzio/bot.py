@@ -1,14 +1,21 @@
 """Telegram bot interface for Nunzio workout assistant."""
 
+import asyncio
 import logging
 import sys
 from urllib.parse import urlparse
 
 from telegram import Update
-from telegram.ext import Application, CommandHandler, MessageHandler, filters
+from telegram.ext import (
+    AIORateLimiter,
+    Application,
+    CommandHandler,
+    MessageHandler,
+    filters,
+)
 
 from .checkin import run_checkins
-from .config import config
+from .config import get_config
 from .core import MessageHandler as NunzioHandler
 from .database.connection import db_manager
 from .database.repository import workout_set_repo
@@ -24,9 +31,7 @@ class NunzioBot:
 
     def __init__(self) -> None:
         self._handler = NunzioHandler(verbose=False)
-        self._allowed_users: set[int] = set()
-        if config.telegram.allowed_user_ids:
-            self._allowed_users = set(config.telegram.allowed_user_ids)
+        self._allowed_users: frozenset[int] = get_config().telegram.allowed_user_ids
 
     def _is_allowed(self, user_id: int | None) -> bool:
         if not self._allowed_users:
@@ -41,23 +46,25 @@ class NunzioBot:
         )
 
     async def _on_message(self, update: Update, _) -> None:
-        if not update.message or not update.message.text:
+        message = update.message
+        if not message or not message.text:
             return
-        if update.effective_user and not self._is_allowed(update.effective_user.id):
+        user = update.effective_user
+        if user and not self._is_allowed(user.id):
             return
 
-        text = update.message.text.strip()
+        text = message.text.strip()
         if not text:
             return
 
         try:
-            await update.message.chat.send_action("typing")
-            response = await self._handler.process(text, update.effective_user.id)
+            await message.chat.send_action("typing")
+            response = await self._handler.process(text, user.id)
         except Exception:
-            logger.exception("Error processing message from %s", update.effective_user.id)
+            logger.exception("Error processing message from %s", user.id)
             response = "Couldn't process that — try again in a sec."
 
-        await update.message.reply_text(response)
+        await message.reply_text(response)
 
     async def _post_init(self, app: Application) -> None:
         await self._handler.initialize()
@@ -98,13 +105,17 @@ class NunzioBot:
         logger.info("Nunzio bot shut down")
 
     def run(self) -> None:
-        if not config.telegram.token:
+        cfg = get_config()
+        if not cfg.telegram.token:
             logger.error("TELEGRAM__TOKEN not set in .env")
             sys.exit(1)
 
         app = (
             Application.builder()
-            .token(config.telegram.token)
+            .token(cfg.telegram.token)
+            # Throttle all outbound calls (replies and check-ins) under Telegram's
+            # flood limits, and retry a 429 after its RetryAfter instead of dropping it.
+            .rate_limiter(AIORateLimiter(max_retries=2))
             .post_init(self._post_init)
             .post_shutdown(self._post_shutdown)
             .build()
@@ -113,17 +124,22 @@ class NunzioBot:
         app.add_handler(CommandHandler("start", self._on_start))
         app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self._on_message))
 
-        llm_host = urlparse(config.llm.base_url).netloc
-        logger.info("Using %s on %s", config.llm.model, llm_host)
+        llm_host = urlparse(cfg.llm.base_url).netloc
+        logger.info("Using %s on %s", cfg.llm.model, llm_host)
         logger.info("Starting Nunzio bot (polling)...")
         app.run_polling()
 
 
 def main() -> None:
-    logging.basicConfig(
-        level=config.logging.level,
-        format=config.logging.format,
-    )
+    log_cfg = get_config().logging
+    logging.basicConfig(level=log_cfg.level, format=log_cfg.format)
+    try:
+        import uvloop
+    except ImportError:  # optional extra: pip install nunzio[uvloop]
+        pass
+    else:
+        # run_polling creates its loop through the policy
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     bot = NunzioBot()
     bot.run()
 
@@ -3,15 +3,60 @@
 import asyncio
 import logging
 import sys
+import threading
 from urllib.parse import urlparse
 
-from .config import config
+from .config import get_config
 from .core import MessageHandler
 
 logger = logging.getLogger(__name__)
 
 CLI_USER_ID = 0
 
+_HELP_TEXT = (
+    "Nunzio Commands:\n"
+    "\n"
+    "  Log a workout:\n"
+    '    "I did 3 sets of bench press at 185 lbs, 10 reps"\n'
+    '    "squat 5x5 at 225 lbs"\n'
+    "\n"
+    "  View stats:\n"
+    '    "show my stats"\n'
+    '    "how have my workouts been?"\n'
+    "\n"
+    "  Get recommendations:\n"
+    '    "what should I do for chest?"\n'
+    '    "suggest some leg exercises"\n'
+    "\n"
+    "  help  - show this message\n"
+    "  exit  - quit"
+)
+
+
+async def _read_line(prompt: str) -> str:
+    """input() on a daemon thread, so the event loop keeps running while we wait.
+
+    Not asyncio.to_thread: the default executor's worker is joined at shutdown,
+    so Ctrl-C would hang until Enter was pressed.
+    """
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def _settle(setter, value) -> None:
+        if not future.done():
+            setter(value)
+
+    def _worker() -> None:
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(_settle, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(_settle, future.set_result, line)
+
+    threading.Thread(target=_worker, daemon=True).start()
+    return await future
+
 
 class NunzioCLI:
     """CLI wrapper around the shared message handler."""
@@ -21,56 +66,40 @@ class NunzioCLI:
 
     async def run(self) -> None:
         await self._handler.initialize()
-        llm_host = urlparse(config.llm.base_url).netloc
-        print(f"Using {config.llm.model} on {llm_host}")
+        llm = get_config().llm
+        print(f"Using {llm.model} on {urlparse(llm.base_url).netloc}")
         print("Nunzio Workout Assistant")
         print("Type 'help' for commands or 'exit' to quit.")
         print("-" * 50)
 
-        while True:
-            try:
-                user_input = input("You: ").strip()
-                if not user_input:
-                    continue
-                if user_input.lower() in ("exit", "quit", "bye"):
-                    print("Goodbye!")
+        try:
+            while True:
+                try:
+                    user_input = (await _read_line("You: ")).strip()
+                    if not user_input:
+                        continue
+                    if user_input.lower() in ("exit", "quit", "bye"):
+                        print("Goodbye!")
+                        break
+                    if user_input.lower() == "help":
+                        self._show_help()
+                        continue
+
+                    response = await self._handler.process(user_input, CLI_USER_ID)
+                    print(f"Nunzio: {response}")
+                    print("-" * 50)
+
+                except (KeyboardInterrupt, EOFError):
+                    print("\nGoodbye!")
                     break
-                if user_input.lower() == "help":
-                    self._show_help()
+                except Exception:
+                    logger.exception("Error processing message")
                     continue
-
-                response = await self._handler.process(user_input, CLI_USER_ID)
-                print(f"Nunzio: {response}")
-                print("-" * 50)
-
-            except (KeyboardInterrupt, EOFError):
-                print("\nGoodbye!")
-                break
-            except Exception:
-                logger.exception("Error processing message")
-                continue
-
-        await self._handler.close()
+        finally:
+            await self._handler.close()
 
     def _show_help(self) -> None:
-        print(
-            "Nunzio Commands:\n"
-            "\n"
-            "  Log a workout:\n"
-            '    "I did 3 sets of bench press at 185 lbs, 10 reps"\n'
-            '    "squat 5x5 at 225 lbs"\n'
-            "\n"
-            "  View stats:\n"
-            '    "show my stats"\n'
-            '    "how have my workouts been?"\n'
-            "\n"
-            "  Get recommendations:\n"
-            '    "what should I do for chest?"\n'
-            '    "suggest some leg exercises"\n'
-            "\n"
-            "  help  - show this message\n"
-            "  exit  - quit"
-        )
+        print(_HELP_TEXT)
 
 
 async def main() -> None:
@@ -80,12 +109,16 @@ async def main() -> None:
 
 def main_sync() -> None:
     """Entry point for pyproject.toml console_scripts."""
-    logging.basicConfig(
-        level=config.logging.level,
-        format=config.logging.format,
-    )
+    log_cfg = get_config().logging
+    logging.basicConfig(level=log_cfg.level, format=log_cfg.format)
+    try:
+        import uvloop
+    except ImportError:  # optional extra: pip install nunzio[uvloop]
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=loop_factory)
     except KeyboardInterrupt:
         print("\nGoodbye!")
         sys.exit(0)
@@ -1,12 +1,14 @@
 """Core message processing — shared by CLI and Telegram bot."""
 
+import asyncio
 import logging
 import re
+import time
 from collections import OrderedDict
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from .config import config
+from .config import get_config
 from .database.connection import db_manager
 from .database.models import now_in_tz
 from .database.repository import (
@@ -18,6 +20,7 @@ from .database.repository import (
 )
 from .llm.client import LLMClient
 from .llm.context import build_coaching_context
+from .llm.schemas import UserIntent
 from .stats import compute_consistency
 
 logger = logging.getLogger(__name__)
@@ -35,6 +38,51 @@ _BODY_WEIGHT_OVERRIDE = ("body weight", "bodyweight", "i weigh", "my weight")
 
 _LBS_PER_KG = 2.20462
 
+# Exact exercise-name → (id, canonical name) cache for logging. Names recur
+# constantly ("bench press", "squat"), so most logs resolve with a primary-key
+# check instead of the name query. Hits are verified against the table on use
+# (clear_and_reseed.py truncates and reuses ids), and the TTL bounds memory.
+_EXERCISE_CACHE_SIZE = 2048
+_EXERCISE_CACHE_TTL = 3600.0
+
+# Delete, repeat-last and stats-paging message patterns, compiled once.
+_WORKOUT_ID_RE = re.compile(r"#?(\d+)")
+_UNDO_RE = re.compile(r"\b(?:undo|last)\b")
+_REPEAT_TRIGGER_RE = re.compile(
+    r"\b(same as last time|repeat last|same thing|another set|another|one more set|one more|again|repeat)\b",
+    re.IGNORECASE,
+)
+_REPS_X_WEIGHT_RE = re.compile(r"\b(\d+)\s*x\s*(\d+(?:\.\d+)?)\s*(lbs?|kg)?\b", re.IGNORECASE)
+_WEIGHT_OVERRIDE_RE = re.compile(
+    r"(?:at|for|@)\s*(\d+(?:\.\d+)?)\s*(lbs?|kg)?\b|(\d+(?:\.\d+)?)\s*(lbs?|kg)\b",
+    re.IGNORECASE,
+)
+_BARE_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+_TIMES_RE = re.compile(r"\btwice\b|\bx\s*(\d+)\b|(\d+)\s*x\b|(\d+)\s+times?\b", re.IGNORECASE)
+_MORE_REQUEST_RE = re.compile(
+    r"(more|next|older|show more|more stats|keep going|go on)[.!]*", re.IGNORECASE
+)
+
+# Repeat "show my PRs"-style views are served from a short per-user cache. Any
+# intent that can write the user's data drops that user's entries.
+_STATS_CACHE_TTL = 60.0
+_STATS_CACHE_SIZE = 32  # views kept per user
+_WRITE_INTENTS = frozenset(
+    {"log_workout", "log_weight", "edit_set", "delete_workout", "repeat_last"}
+)
+
+# Bare commands ("stats", "undo", "delete #42", "again") are unambiguous and carry
+# no dates, so they skip the classifier round-trip entirely.
+_STATS_COMMAND_RE = re.compile(r"/?(?:show\s+(?:me\s+)?(?:my\s+)?)?stats[.!?]*", re.IGNORECASE)
+_DELETE_COMMAND_RE = re.compile(
+    r"/?(?:undo(?:\s+last)?|(?:delete|remove)\s+(?:last|(?:workout\s+)?#?\d+))[.!]*",
+    re.IGNORECASE,
+)
+_REPEAT_COMMAND_RE = re.compile(r"/?(?:again|repeat(?:\s+last)?)[.!]*", re.IGNORECASE)
+
+# Notes that should soften the log comment ("knee felt sore", "Pain in shoulder").
+_PAIN_RE = re.compile(r"pain|sore|hurt", re.IGNORECASE)
+
 # Map loose category words to the canonical muscle_group values seeded in the DB,
 # so "what aerobic have I done" resolves to the cardio group instead of dead-ending.
 _GROUP_SYNONYMS = {
@@ -74,12 +122,33 @@ class MessageHandler:
         # Per-user page index for "more" pagination of the stats overview. In-memory
         # only (single-process bot) — reset on restart, which is fine for a UX nicety.
         self._stats_pages: dict[int, int] = {}
+        self._exercise_cache: OrderedDict[str, tuple[int, str, float]] = OrderedDict()
+        # Per-user rendered stats views: {user_id: {view key: (expires_at, response)}}.
+        # Dropped whenever the user writes (see _WRITE_INTENTS), else expires by TTL.
+        self._stats_cache: dict[int, dict[tuple, tuple[float, str]]] = {}
+        # Each user's in-flight message_log write. Held so the loop doesn't GC it
+        # mid-flight, and awaited by that user's next process() so the coaching
+        # context always sees the previous turn.
+        self._pending_logs: dict[int, asyncio.Task] = {}
+        # Intent → handler, each called as (message, intent, user_id, user_tz).
+        # log_workout (confidence-gated) and the coaching fallback stay in process().
+        self._routes = {
+            "log_weight": lambda m, i, u, tz: self._handle_log_weight(m, u, tz),
+            "set_timezone": lambda m, i, u, tz: self._handle_set_timezone(i, u),
+            "view_stats": lambda m, i, u, tz: self._handle_view_stats(i, u, tz, m),
+            "list_workouts": lambda m, i, u, tz: self._handle_list_workouts(u),
+            "edit_set": lambda m, i, u, tz: self._handle_edit_set(m, u),
+            "delete_workout": lambda m, i, u, tz: self._handle_delete_workout(m, u),
+            "repeat_last": lambda m, i, u, tz: self._handle_repeat_last(m, u, tz),
+        }
 
     async def initialize(self) -> None:
         await db_manager.initialize()
         await self._llm.initialize()
 
     async def close(self) -> None:
+        if self._pending_logs:
+            await asyncio.gather(*self._pending_logs.values(), return_exceptions=True)
         await self._llm.close()
         await db_manager.close()
 
@@ -92,37 +161,49 @@ class MessageHandler:
         instead of firing a workout extraction on every message (including
         stats, coaching, and delete) — wasted load on a single-GPU backend.
         """
+        # Let the previous turn's log write land first; it's normally long done.
+        pending = self._pending_logs.get(user_id)
+        if pending is not None:
+            await asyncio.wait((pending,))
+
         # Resolve the user's timezone once, up front, so date words ("yesterday",
         # "today") in this message resolve in the zone they're currently in.
         async with db_manager.get_session() as session:
             user_tz = await user_settings_repo.get_timezone(session, user_id)
 
-        intent = await self._llm.classify_intent(message, user_tz)
+        intent = self._fast_intent(message) or await self._llm.classify_intent(
+            message, user_tz
+        )
 
         if intent.intent == "log_workout" and intent.confidence > 0.5:
             # _handle_log_workout extracts the workout data itself (sequentially).
             response = await self._handle_log_workout(message, user_id, user_tz)
-        elif intent.intent == "log_weight":
-            response = await self._handle_log_weight(message, user_id, user_tz)
-        elif intent.intent == "set_timezone":
-            response = await self._handle_set_timezone(intent, user_id)
-        elif intent.intent == "view_stats":
-            response = await self._handle_view_stats(intent, user_id, user_tz, message)
-        elif intent.intent == "list_workouts":
-            response = await self._handle_list_workouts(user_id)
-        elif intent.intent == "edit_set":
-            response = await self._handle_edit_set(message, user_id)
-        elif intent.intent == "delete_workout":
-            response = await self._handle_delete_workout(message, user_id)
-        elif intent.intent == "repeat_last":
-            response = await self._handle_repeat_last(message, user_id, user_tz)
+        elif (route := self._routes.get(intent.intent)) is not None:
+            response = await route(message, intent, user_id, user_tz)
         else:
             response = await self._handle_coaching(message, intent, user_id, user_tz)
 
+        if intent.intent in _WRITE_INTENTS:
+            self._stats_cache.pop(user_id, None)
+
         if self._llm.model_override:
-            response += f"\n(using {self._llm.model_override} instead of configured {config.llm.model})"
+            response += f"\n(using {self._llm.model_override} instead of configured {get_config().llm.model})"
 
-        # Fire-and-forget message logging — failure must not block the response
+        # Fire-and-forget message logging — the reply doesn't wait on this write
+        task = asyncio.create_task(self._log_message(user_id, message, intent, response))
+        self._pending_logs[user_id] = task
+        task.add_done_callback(lambda t: self._forget_log(user_id, t))
+
+        return response
+
+    def _forget_log(self, user_id: int, task: asyncio.Task) -> None:
+        if self._pending_logs.get(user_id) is task:
+            del self._pending_logs[user_id]
+
+    async def _log_message(
+        self, user_id: int, message: str, intent, response: str
+    ) -> None:
+        """Write one message_log row; failures are logged, never raised."""
         try:
             extracted_data = intent.model_dump_json(exclude_none=True)
         except Exception:
@@ -143,7 +224,17 @@ class MessageHandler:
         except Exception:
             logger.warning("Message logging failed", exc_info=True)
 
-        return response
+    @staticmethod
+    def _fast_intent(message: str) -> UserIntent | None:
+        """Intent for messages that need no LLM classification, else None."""
+        text = message.strip()
+        if _STATS_COMMAND_RE.fullmatch(text):
+            return UserIntent(intent="view_stats", confidence=1.0, stats_type="overview")
+        if _DELETE_COMMAND_RE.fullmatch(text):
+            return UserIntent(intent="delete_workout", confidence=1.0)
+        if _REPEAT_COMMAND_RE.fullmatch(text):
+            return UserIntent(intent="repeat_last", confidence=1.0)
+        return None
 
     @staticmethod
     def _swap_if_inverted(ex_set) -> bool:
@@ -166,22 +257,40 @@ class MessageHandler:
         Catches the LLM mistake where "2 sets of 10" becomes one ExerciseSet
         with set_number=2 instead of two separate objects.
         """
-        from collections import Counter
-
         # Count how many ExerciseSet objects exist per exercise name
-        name_counts = Counter(ex.exercise_name for ex in exercises)
+        name_counts: dict[str, int] = {}
+        for ex in exercises:
+            name_counts[ex.exercise_name] = name_counts.get(ex.exercise_name, 0) + 1
 
         expanded: list = []
         for ex in exercises:
             if name_counts[ex.exercise_name] == 1 and ex.set_number > 1:
-                # Single entry with set_number > 1 → likely "N sets" misread as set #N
+                # Single entry with set_number > 1 → likely "N sets" misread as set #N.
+                # Copies only — the caller's parsed object is left as extracted.
                 for i in range(1, ex.set_number + 1):
-                    copy = ex.model_copy(update={"set_number": i})
-                    expanded.append(copy)
+                    expanded.append(ex.model_copy(update={"set_number": i}))
             else:
                 expanded.append(ex)
         return expanded
 
+    def _cached_exercise(self, name: str) -> tuple[int, str] | None:
+        """(id, canonical name) for an exactly-matched exercise name, if cached and fresh."""
+        entry = self._exercise_cache.get(name.lower())
+        if entry is None:
+            return None
+        exercise_id, canonical, stored_at = entry
+        if time.monotonic() - stored_at > _EXERCISE_CACHE_TTL:
+            del self._exercise_cache[name.lower()]
+            return None
+        self._exercise_cache.move_to_end(name.lower())
+        return exercise_id, canonical
+
+    def _cache_exercise(self, name: str, exercise_id: int, canonical: str) -> None:
+        self._exercise_cache[name.lower()] = (exercise_id, canonical, time.monotonic())
+        self._exercise_cache.move_to_end(name.lower())
+        if len(self._exercise_cache) > _EXERCISE_CACHE_SIZE:
+            self._exercise_cache.popitem(last=False)
+
     async def _handle_log_workout(
         self, message: str, user_id: int, user_tz: str = "America/New_York", *, workout_data=None
     ) -> str:
@@ -209,99 +318,149 @@ class MessageHandler:
             if self._swap_if_inverted(ex_set):
                 swapped = True
 
+        # One clock read for the stored set_date and the "for <date>" header below.
+        local_now = now_in_tz(user_tz)
+        if workout_data.date:
+            now = datetime.combine(workout_data.date, local_now.time())
+        else:
+            now = local_now
+
         async with db_manager.get_session() as session:
             batch_id = await workout_set_repo.get_next_batch_id(session, user_id)
-            if workout_data.date:
-                now = datetime.combine(workout_data.date, now_in_tz(user_tz).time())
-            else:
-                now = now_in_tz(user_tz)
 
-            logged: list[str] = []
-            logged_set_data: list[dict] = []
-            history: list = []
-            for set_idx, ex_set in enumerate(workout_data.exercises):
-                raw_name = ex_set.exercise_name
-                matched_differently = False
-
-                # 1. Exact name match
-                exercise = await exercise_repo.get_by_name(session, raw_name)
-
-                if not exercise:
-                    # 2. Scored matching against catalog
-                    scored = await exercise_repo.search_scored(session, raw_name)
-                    if scored and scored[0][1] >= 0.5:
-                        exercise = scored[0][0]
-                        matched_differently = (exercise.name.lower() != raw_name.lower())
-                    else:
-                        # 3. Score too low — create ad-hoc exercise with user's name
-                        exercise = await exercise_repo.create(
-                            session,
-                            obj_in={
-                                "name": raw_name,
-                                "muscle_group": "general",
-                            },
-                        )
-
-                unit = ex_set.unit if ex_set.unit != "bodyweight" else "lbs"
-                await workout_set_repo.create(
-                    session,
-                    obj_in={
-                        "user_id": user_id,
-                        "batch_id": batch_id,
-                        "set_date": now,
-                        "exercise_id": exercise.id,
-                        "set_number": ex_set.set_number,
-                        "reps": ex_set.reps,
-                        "weight": ex_set.weight,
-                        "weight_unit": unit,
-                        "duration_minutes": ex_set.duration_minutes,
-                        "distance": ex_set.distance,
-                        "raw_exercise_name": raw_name,
-                        "notes": ex_set.notes,
-                    },
+            # Resolve every distinct name up front: cache hits first, then one IN query
+            # for exact matches, one catalog read for scored matches, and one INSERT
+            # for ad-hoc exercises.
+            raw_names = list({
+                ex.exercise_name.lower(): ex.exercise_name for ex in workout_data.exercises
+            }.values())
+            resolved: dict[str, tuple[int, str]] = {}
+            for raw_name in raw_names:
+                hit = self._cached_exercise(raw_name)
+                if hit:
+                    resolved[raw_name.lower()] = hit
+            if resolved:
+                # A hit only counts if its id still names the same exercise — a
+                # reseed can delete the id or hand it to a different exercise.
+                live = await exercise_repo.get_names_by_ids(
+                    session, [eid for eid, _ in resolved.values()]
                 )
-
-                # Build display name — show mapping when matched differently
-                display_name = exercise.name
-                if matched_differently:
-                    display_name = f'{exercise.name} (from "{raw_name}")'
-
-                if ex_set.duration_minutes:
-                    parts = [f"{ex_set.duration_minutes} min"]
-                    if ex_set.distance:
-                        parts.append(f"{ex_set.distance} mi")
-                    line = f"  {display_name}: {', '.join(parts)}"
-                else:
-                    weight_str = (
-                        f"{ex_set.weight} {ex_set.unit}" if ex_set.weight else "bodyweight"
+                for key, (eid, canonical) in list(resolved.items()):
+                    if live.get(eid) != canonical:
+                        del resolved[key]
+                        self._exercise_cache.pop(key, None)
+            lookup = [n for n in raw_names if n.lower() not in resolved]
+            found = await exercise_repo.get_by_names(session, lookup)
+            fuzzy: set[str] = set()
+            unmatched = [n for n in lookup if n.lower() not in found]
+            if unmatched:
+                catalog = await exercise_repo.get_all(session)
+                new_names: list[str] = []
+                for raw_name in unmatched:
+                    # Scored matching against catalog; too low a score → ad-hoc exercise
+                    best, score = max(
+                        ((ex, exercise_repo.score_match(raw_name, ex.name)) for ex in catalog),
+                        key=lambda pair: pair[1],
+                        default=(None, 0.0),
+                    )
+                    if best and score >= 0.5:
+                        resolved[raw_name.lower()] = (best.id, best.name)
+                        fuzzy.add(raw_name.lower())
+                    else:
+                        new_names.append(raw_name)
+                if new_names:
+                    await exercise_repo.bulk_create(
+                        session,
+                        [{"name": n, "muscle_group": "general"} for n in new_names],
                     )
-                    reps_display = f"{ex_set.reps} reps"
-                    if set_idx in defaulted_reps:
-                        reps_display += " (assumed)"
-                    line = f"  {display_name}: set {ex_set.set_number} - {reps_display} @ {weight_str}"
-
-                if ex_set.notes:
-                    line += f" — note: {ex_set.notes}"
-                logged.append(line)
-                logged_set_data.append({
-                    "exercise_id": exercise.id,
-                    "name": exercise.name,
+                    found.update(await exercise_repo.get_by_names(session, new_names))
+            for key, ex in found.items():
+                resolved[key] = (ex.id, ex.name)
+
+            # Persist first — one multi-row INSERT — then render the confirmation.
+            await workout_set_repo.bulk_create(session, [
+                {
+                    "user_id": user_id,
+                    "batch_id": batch_id,
+                    "set_date": now,
+                    "exercise_id": resolved[ex_set.exercise_name.lower()][0],
                     "set_number": ex_set.set_number,
-                    "weight": ex_set.weight,
                     "reps": ex_set.reps,
-                    "unit": unit,
+                    "weight": ex_set.weight,
+                    "weight_unit": ex_set.unit if ex_set.unit != "bodyweight" else "lbs",
                     "duration_minutes": ex_set.duration_minutes,
                     "distance": ex_set.distance,
+                    "raw_exercise_name": ex_set.exercise_name,
                     "notes": ex_set.notes,
-                    "is_cardio": bool(ex_set.duration_minutes),
-                })
+                }
+                for ex_set in workout_data.exercises
+            ])
 
             # Query history for personality comment
-            exercise_ids = list({d["exercise_id"] for d in logged_set_data})
+            exercise_ids = list({exercise_id for exercise_id, _ in resolved.values()})
             history = await workout_set_repo.get_recent_for_exercises(
                 session, exercise_ids, user_id, exclude_batch=batch_id
             )
 
+        # Only cache once the session has committed, so a rolled-back ad-hoc
+        # exercise never leaves a dangling id behind.
+        for key, ex in found.items():
+            self._cache_exercise(key, ex.id, ex.name)
+
+        # Format the confirmation after commit, so the connection goes back to the
+        # pool as soon as the writes are done.
+        logged: list[str] = []
+        logged_set_data: list[dict] = []
+        volume_by_unit: dict[str, float] = {}
+        for set_idx, ex_set in enumerate(workout_data.exercises):
+            raw_name = ex_set.exercise_name
+            exercise_id, exercise_name = resolved[raw_name.lower()]
+            matched_differently = (
+                raw_name.lower() in fuzzy and exercise_name.lower() != raw_name.lower()
+            )
+            is_bodyweight = ex_set.unit == "bodyweight"
+            unit = "lbs" if is_bodyweight else ex_set.unit
+            if not is_bodyweight and ex_set.weight:
+                vol_unit = ex_set.unit or "lbs"
+                volume_by_unit[vol_unit] = (
+                    volume_by_unit.get(vol_unit, 0) + ex_set.weight * (ex_set.reps or 0)
+                )
+
+            # Build display name — show mapping when matched differently
+            display_name = exercise_name
+            if matched_differently:
+                display_name = f'{exercise_name} (from "{raw_name}")'
+
+            if ex_set.duration_minutes:
+                parts = [f"{ex_set.duration_minutes} min"]
+                if ex_set.distance:
+                    parts.append(f"{ex_set.distance} mi")
+                line = f"  {display_name}: {', '.join(parts)}"
+            else:
+                weight_str = (
+                    f"{ex_set.weight} {ex_set.unit}" if ex_set.weight else "bodyweight"
+                )
+                reps_display = f"{ex_set.reps} reps"
+                if set_idx in defaulted_reps:
+                    reps_display += " (assumed)"
+                line = f"  {display_name}: set {ex_set.set_number} - {reps_display} @ {weight_str}"
+
+            if ex_set.notes:
+                line += f" — note: {ex_set.notes}"
+            logged.append(line)
+            logged_set_data.append({
+                "exercise_id": exercise_id,
+                "name": exercise_name,
+                "set_number": ex_set.set_number,
+                "weight": ex_set.weight,
+                "reps": ex_set.reps,
+                "unit": unit,
+                "duration_minutes": ex_set.duration_minutes,
+                "distance": ex_set.distance,
+                "notes": ex_set.notes,
+                "is_cardio": bool(ex_set.duration_minutes),
+            })
+
         # Heuristic decides whether anything noteworthy happened. If so, upgrade to an
         # LLM-written, data-grounded one-liner; fall back to the heuristic on any failure.
         comment = self._generate_log_comment(logged_set_data, history, now)
@@ -311,18 +470,12 @@ class MessageHandler:
             if llm_comment:
                 comment = llm_comment
 
-        if workout_data.date and workout_data.date != now_in_tz(user_tz).date():
+        if workout_data.date and workout_data.date != local_now.date():
             date_label = workout_data.date.strftime("%b %-d")
             header = f"Logged workout (#{batch_id}) for {date_label}:" if self._verbose else f"Logged for {date_label}:"
         else:
             header = f"Logged workout (#{batch_id}):" if self._verbose else "Logged:"
         lines = [header] + logged
-        volume_by_unit: dict[str, float] = {}
-        for s in workout_data.exercises:
-            if s.unit == "bodyweight" or not s.weight:
-                continue
-            unit = s.unit or "lbs"
-            volume_by_unit[unit] = volume_by_unit.get(unit, 0) + s.weight * (s.reps or 0)
         for unit, vol in volume_by_unit.items():
             if vol > 0:
                 lines.append(f"  Total volume: {vol:.0f} {unit}")
@@ -350,11 +503,22 @@ class MessageHandler:
         if not logged_sets:
             return None
 
-        # Build per-exercise history lookup
-        # hist_by_ex: {exercise_id: [WorkoutSet, ...]} ordered newest first
-        hist_by_ex: dict[int, list] = {}
+        # One pass each over this batch and the history, keyed by exercise_id
+        max_current: dict[int, float] = {}
+        for s in logged_sets:
+            if s["weight"]:
+                eid = s["exercise_id"]
+                max_current[eid] = max(max_current.get(eid, 0), s["weight"])
+        max_historical: dict[int, float] = {}
+        last_date: dict[int, datetime] = {}
+        most_recent: dict[int, object] = {}  # history is ordered newest first
         for ws in history:
-            hist_by_ex.setdefault(ws.exercise_id, []).append(ws)
+            eid = ws.exercise_id
+            most_recent.setdefault(eid, ws)
+            if ws.weight is not None:
+                max_historical[eid] = max(max_historical.get(eid, 0), ws.weight)
+            if eid not in last_date or ws.set_date > last_date[eid]:
+                last_date[eid] = ws.set_date
 
         # Unique exercises from this batch (preserve order)
         seen_ids: set[int] = set()
@@ -370,30 +534,19 @@ class MessageHandler:
         for ex in exercises:
             if ex["is_cardio"] or not ex["weight"]:
                 continue
-            ex_hist = hist_by_ex.get(ex["exercise_id"], [])
-            max_current = max(
-                (s["weight"] for s in logged_sets
-                 if s["exercise_id"] == ex["exercise_id"] and s["weight"]),
-                default=0,
-            )
-            max_historical = max(
-                (ws.weight for ws in ex_hist if ws.weight is not None),
-                default=0,
-            )
-            if max_historical > 0 and max_current > max_historical:
+            best = max_historical.get(ex["exercise_id"], 0)
+            if best > 0 and max_current.get(ex["exercise_id"], 0) > best:
                 return f"New PR on {ex['name']}!"
 
         # 2. First time
         for ex in exercises:
-            if ex["exercise_id"] not in hist_by_ex:
+            if ex["exercise_id"] not in most_recent:
                 return f"First time logging {ex['name']}."
 
         # 3. Back after gap (>3 days)
         for ex in exercises:
-            ex_hist = hist_by_ex.get(ex["exercise_id"], [])
-            if ex_hist:
-                most_recent_date = max(ws.set_date for ws in ex_hist)
-                gap_days = (now - most_recent_date).days
+            if ex["exercise_id"] in last_date:
+                gap_days = (now - last_date[ex["exercise_id"]]).days
                 if gap_days > 3:
                     return f"Back at it after {gap_days} days."
 
@@ -401,18 +554,13 @@ class MessageHandler:
         for ex in exercises:
             if ex["is_cardio"] or not ex["weight"]:
                 continue
-            ex_hist = hist_by_ex.get(ex["exercise_id"], [])
-            if not ex_hist:
-                continue
-            # Most recent historical set for this exercise
-            most_recent = ex_hist[0]  # already sorted newest first
-            if most_recent.weight and ex["weight"] > most_recent.weight:
+            prev = most_recent.get(ex["exercise_id"])
+            if prev is not None and prev.weight and ex["weight"] > prev.weight:
                 return f"Moving up in weight on {ex['name']}."
 
         # 5. Pain in notes
-        pain_words = {"pain", "sore", "hurt"}
         for s in logged_sets:
-            if s["notes"] and any(w in s["notes"].lower() for w in pain_words):
+            if s["notes"] and _PAIN_RE.search(s["notes"]):
                 return "Take it easy if the pain persists."
 
         return None
@@ -491,7 +639,7 @@ class MessageHandler:
     @staticmethod
     def _parse_workout_id(message: str) -> int | None:
         """Extract a workout ID from a message like 'delete #42' or 'delete 42'."""
-        match = re.search(r"#?(\d+)", message)
+        match = _WORKOUT_ID_RE.search(message)
         if match:
             return int(match.group(1))
         return None
@@ -501,7 +649,7 @@ class MessageHandler:
         msg_lower = message.lower()
         async with db_manager.get_session() as session:
             # "undo", "delete last", or no specific ID → delete most recent
-            if any(word in msg_lower for word in ["undo", "last"]) or not re.search(r"\d+", message):
+            if _UNDO_RE.search(msg_lower) or not _WORKOUT_ID_RE.search(message):
                 latest = await workout_set_repo.get_latest_batch_for_user(session, user_id)
                 if not latest:
                     return "Nothing to delete — no workouts found."
@@ -516,11 +664,10 @@ class MessageHandler:
                 return f"Workout #{batch_id} not found (or not yours)."
 
             # Build confirmation showing what was deleted
-            exercises: list[str] = []
-            for s in deleted:
-                name = s.exercise.name if s.exercise else f"exercise #{s.exercise_id}"
-                if name not in exercises:
-                    exercises.append(name)
+            exercises = list(dict.fromkeys(
+                s.exercise.name if s.exercise else f"exercise #{s.exercise_id}"
+                for s in deleted
+            ))
             date_str = deleted[0].set_date.strftime("%b %-d")
             ex_str = ", ".join(exercises) if exercises else "no exercises"
             return f"Deleted workout #{batch_id} ({date_str}): {ex_str} — {len(deleted)} sets removed."
@@ -576,12 +723,8 @@ class MessageHandler:
 
             elif data.exercise_name:
                 # Resolve exercise name
-                exercise = await exercise_repo.get_by_name(session, data.exercise_name)
-                if not exercise:
-                    scored = await exercise_repo.search_scored(session, data.exercise_name)
-                    if scored and scored[0][1] >= 0.3:
-                        exercise = scored[0][0]
-                if not exercise:
+                exercise, score = await exercise_repo.match_or_score(session, data.exercise_name)
+                if score < 0.3:
                     return f"Exercise '{data.exercise_name}' not found."
                 target_sets = await workout_set_repo.get_latest_sets_for_exercise(
                     session, exercise.id, user_id
@@ -639,12 +782,7 @@ class MessageHandler:
         Returns dict with keys: reps, weight, weight_unit, times, note.
         """
         # Strip trigger words first
-        stripped = re.sub(
-            r"\b(same as last time|repeat last|same thing|another set|another|one more set|one more|again|repeat)\b",
-            "",
-            message,
-            flags=re.IGNORECASE,
-        ).strip(" ,.-;:")
+        stripped = _REPEAT_TRIGGER_RE.sub("", message).strip(" ,.-;:")
 
         reps = None
         weight = None
@@ -653,11 +791,7 @@ class MessageHandler:
         note = stripped
 
         # Reps × weight shorthand: "10x55", "8 x 100 kg", "10x50 lbs"
-        reps_weight_match = re.search(
-            r"\b(\d+)\s*x\s*(\d+(?:\.\d+)?)\s*(lbs?|kg)?\b",
-            note,
-            re.IGNORECASE,
-        )
+        reps_weight_match = _REPS_X_WEIGHT_RE.search(note)
         if reps_weight_match:
             reps = int(reps_weight_match.group(1))
             weight = float(reps_weight_match.group(2))
@@ -666,30 +800,21 @@ class MessageHandler:
             note = note[:reps_weight_match.start()] + note[reps_weight_match.end():]
         else:
             # Weight override: "at 35 lb", "for 35 lbs", "@ 40", "35 lb", "35 kg"
-            weight_match = re.search(
-                r"(?:at|for|@)\s*(\d+(?:\.\d+)?)\s*(lbs?|kg)?\b"
-                r"|(\d+(?:\.\d+)?)\s*(lbs?|kg)\b",
-                note,
-                re.IGNORECASE,
-            )
+            weight_match = _WEIGHT_OVERRIDE_RE.search(note)
             if weight_match:
                 w = weight_match.group(1) or weight_match.group(3)
                 u = weight_match.group(2) or weight_match.group(4)
                 weight = float(w)
                 weight_unit = "kg" if u and u.lower().startswith("k") else "lbs"
                 note = note[:weight_match.start()] + note[weight_match.end():]
-            elif re.fullmatch(r"\d+(?:\.\d+)?", note):
+            elif _BARE_NUMBER_RE.fullmatch(note):
                 # Bare number with no unit: "again 54" → 54 lbs
                 weight = float(note)
                 weight_unit = "lbs"
                 note = None
 
         # Repetition count: "twice", "x2", "2x", "2 times", "3 times"
-        times_match = re.search(
-            r"\btwice\b|\bx\s*(\d+)\b|(\d+)\s*x\b|(\d+)\s+times?\b",
-            note or "",
-            re.IGNORECASE,
-        )
+        times_match = _TIMES_RE.search(note or "")
         if times_match:
             if "twice" in (times_match.group(0) or "").lower():
                 times = 2
@@ -717,32 +842,32 @@ class MessageHandler:
             now = now_in_tz(user_tz)
             sorted_sets = sorted(last_sets, key=lambda s: (s.exercise_id, s.set_number))
 
+            # Repeats get consecutive batch ids; all sets go in one INSERT.
+            first_batch_id = await workout_set_repo.get_next_batch_id(session, user_id)
+            rows: list[dict] = []
             logged: list[str] = []
-            for _rep in range(mods["times"]):
-                new_batch_id = await workout_set_repo.get_next_batch_id(session, user_id)
+            for rep in range(mods["times"]):
+                new_batch_id = first_batch_id + rep
 
                 for old_set in sorted_sets:
                     use_weight = mods["weight"] if mods["weight"] is not None else old_set.weight
                     use_unit = mods["weight_unit"] if mods["weight_unit"] is not None else old_set.weight_unit
                     use_reps = mods["reps"] if mods["reps"] is not None else old_set.reps
 
-                    await workout_set_repo.create(
-                        session,
-                        obj_in={
-                            "user_id": user_id,
-                            "batch_id": new_batch_id,
-                            "set_date": now,
-                            "exercise_id": old_set.exercise_id,
-                            "set_number": old_set.set_number,
-                            "reps": use_reps,
-                            "weight": use_weight,
-                            "weight_unit": use_unit,
-                            "duration_minutes": old_set.duration_minutes,
-                            "distance": old_set.distance,
-                            "raw_exercise_name": old_set.raw_exercise_name,
-                            "notes": mods["note"],
-                        },
-                    )
+                    rows.append({
+                        "user_id": user_id,
+                        "batch_id": new_batch_id,
+                        "set_date": now,
+                        "exercise_id": old_set.exercise_id,
+                        "set_number": old_set.set_number,
+                        "reps": use_reps,
+                        "weight": use_weight,
+                        "weight_unit": use_unit,
+                        "duration_minutes": old_set.duration_minutes,
+                        "distance": old_set.distance,
+                        "raw_exercise_name": old_set.raw_exercise_name,
+                        "notes": mods["note"],
+                    })
                     name = old_set.exercise.name if old_set.exercise else f"exercise #{old_set.exercise_id}"
                     if old_set.duration_minutes:
                         parts = [f"{old_set.duration_minutes} min"]
@@ -756,6 +881,8 @@ class MessageHandler:
                         line += f" — note: {mods['note']}"
                     logged.append(line)
 
+            await workout_set_repo.bulk_create(session, rows)
+
         header = f"Repeated #{old_batch_id} → #{new_batch_id}:" if self._verbose else "Repeated last workout:"
         if mods["times"] > 1:
             header = f"Repeated #{old_batch_id} x{mods['times']}:" if self._verbose else f"Repeated last workout x{mods['times']}:"
@@ -774,34 +901,50 @@ class MessageHandler:
     @staticmethod
     def _is_more_request(message: str) -> bool:
         """True for a bare 'more'/'next'/'older' follow-up (stats pagination)."""
-        return bool(
-            re.fullmatch(
-                r"(more|next|older|show more|more stats|keep going|go on)[.!]*",
-                message.strip(),
-                re.IGNORECASE,
-            )
-        )
+        return bool(_MORE_REQUEST_RE.fullmatch(message.strip()))
 
     async def _handle_view_stats(
         self, intent, user_id: int, user_tz: str = "America/New_York", message: str = ""
     ) -> str:
         stats_type = getattr(intent, "stats_type", None) or "overview"
+        if stats_type not in ("prs", "exercise_history", "volume", "consistency", "weight"):
+            page = self._stats_pages.get(user_id, 0) + 1 if self._is_more_request(message) else 0
+            return await self._handle_overview(user_id, intent, user_tz, page=page)
+
         # Non-overview views aren't paginated — clear any stale page cursor.
-        if stats_type in ("prs", "exercise_history", "volume", "consistency", "weight"):
-            self._stats_pages.pop(user_id, None)
+        self._stats_pages.pop(user_id, None)
+        key = (
+            stats_type,
+            user_tz,
+            tuple(getattr(intent, "mentioned_exercises", None) or ()),
+            tuple(getattr(intent, "mentioned_muscle_groups", None) or ()),
+        )
+        user_cache = self._stats_cache.setdefault(user_id, {})
+        now = time.monotonic()
+        hit = user_cache.get(key)
+        if hit and now < hit[0]:
+            return hit[1]
+
         if stats_type == "prs":
-            return await self._handle_prs(user_id)
+            response = await self._handle_prs(user_id)
         elif stats_type == "exercise_history":
-            return await self._handle_exercise_history(intent, user_id)
+            response = await self._handle_exercise_history(intent, user_id)
         elif stats_type == "volume":
-            return await self._handle_volume_trends(user_id)
+            response = await self._handle_volume_trends(user_id)
         elif stats_type == "consistency":
-            return await self._handle_consistency(user_id, user_tz)
-        elif stats_type == "weight":
-            return await self._handle_weight_trend(user_id)
+            response = await self._handle_consistency(user_id, user_tz)
         else:
-            page = self._stats_pages.get(user_id, 0) + 1 if self._is_more_request(message) else 0
-            return await self._handle_overview(user_id, intent, user_tz, page=page)
+            response = await self._handle_weight_trend(user_id)
+
+        # On a miss, drop this user's expired views and cap the rest, oldest first
+        # (keys carry free-form exercise/group names, so they don't repeat reliably).
+        for stale in [k for k, (expires, _) in user_cache.items() if expires <= now]:
+            del user_cache[stale]
+        user_cache.pop(key, None)
+        user_cache[key] = (time.monotonic() + _STATS_CACHE_TTL, response)
+        if len(user_cache) > _STATS_CACHE_SIZE:
+            del user_cache[next(iter(user_cache))]
+        return response
 
     async def _handle_overview(
         self, user_id: int, intent=None, user_tz: str = "America/New_York", *, page: int = 0
@@ -860,7 +1003,7 @@ class MessageHandler:
                 return "No workouts logged yet. Tell me about a workout to get started!"
 
             # Group sets by date
-            days: OrderedDict[str, list] = OrderedDict()
+            days: dict[str, list] = {}
             for ws in (reversed(all_sets) if default_view else all_sets):
                 date_key = ws.set_date.strftime("%a %b %-d")
                 days.setdefault(date_key, []).append(ws)
@@ -877,7 +1020,7 @@ class MessageHandler:
                 has_more = len(newest_first) > start_i + per_page
                 self._stats_pages[user_id] = page
                 # Restore oldest→newest order within the page for display.
-                days = OrderedDict(reversed(page_items))
+                days = dict(reversed(page_items))
 
             lines: list[str] = []
             for i, (date_key, day_sets) in enumerate(days.items()):
@@ -885,7 +1028,7 @@ class MessageHandler:
                     lines.append("")
                 lines.append(date_key)
 
-                exercises: OrderedDict[int, list] = OrderedDict()
+                exercises: dict[int, list] = {}
                 for s in day_sets:
                     exercises.setdefault(s.exercise_id, []).append(s)
 
@@ -901,10 +1044,8 @@ class MessageHandler:
                         lines.append(f"  {name} \u2014 {', '.join(parts)}")
                         continue
 
-                    all_same = all(
-                        s.reps == first.reps and s.weight == first.weight
-                        for s in ex_sets
-                    )
+                    fr, fw = first.reps, first.weight
+                    all_same = all(s.reps == fr and s.weight == fw for s in ex_sets)
 
                     if all_same and first.weight is not None:
                         w_str = self._fmt_weight(first.weight, first.weight_unit)
@@ -951,13 +1092,10 @@ class MessageHandler:
             # Resolve exercise from mentioned_exercises
             exercise = None
             for name in getattr(intent, "mentioned_exercises", []):
-                exercise = await exercise_repo.get_by_name(session, name)
-                if not exercise:
-                    scored = await exercise_repo.search_scored(session, name)
-                    if scored and scored[0][1] >= 0.3:
-                        exercise = scored[0][0]
-                if exercise:
+                exercise, score = await exercise_repo.match_or_score(session, name)
+                if score >= 0.3:
                     break
+                exercise = None
 
             if not exercise:
                 # Category fallback: "what aerobic have I done" names a group, not a
@@ -975,7 +1113,7 @@ class MessageHandler:
                 return f"No history for {exercise.name}."
 
             # Group by batch_id
-            batches: OrderedDict[int, list] = OrderedDict()
+            batches: dict[int, list] = {}
             for s in sets:
                 batches.setdefault(s.batch_id, []).append(s)
 
@@ -991,10 +1129,8 @@ class MessageHandler:
                     lines.append(f"  {date_str}: {', '.join(parts)}")
                 else:
                     n = len(batch_sets)
-                    all_same = all(
-                        s.reps == first.reps and s.weight == first.weight
-                        for s in batch_sets
-                    )
+                    fr, fw = first.reps, first.weight
+                    all_same = all(s.reps == fr and s.weight == fw for s in batch_sets)
                     if all_same and first.weight is not None:
                         w_str = self._fmt_weight(first.weight, first.weight_unit)
                         lines.append(f"  {date_str}: {n}x{first.reps} @ {w_str}")
@@ -1026,17 +1162,15 @@ class MessageHandler:
         if not exercises:
             return f"No exercises catalogued for {group}."
 
-        # Gather recent sets across the group, then group by session (batch_id).
-        all_sets: list = []
-        for ex in exercises:
-            all_sets.extend(
-                await workout_set_repo.get_by_exercise(session, ex.id, user_id, limit=20)
-            )
+        # Gather recent sets across the group in one query, then group by session (batch_id).
+        all_sets = await workout_set_repo.get_recent_for_exercises(
+            session, [ex.id for ex in exercises], user_id
+        )
         if not all_sets:
             return f"No {group} sessions logged yet."
 
         all_sets.sort(key=lambda s: s.set_date, reverse=True)
-        batches: OrderedDict[int, list] = OrderedDict()
+        batches: dict[int, list] = {}
         for s in all_sets:
             batches.setdefault(s.batch_id, []).append(s)
 
@@ -1073,7 +1207,7 @@ class MessageHandler:
                 return "No volume data yet — log some weighted exercises first!"
 
             # Group by yearweek
-            weeks: OrderedDict[int, list] = OrderedDict()
+            weeks: dict[int, list] = {}
             for yw, mg, vol in rows:
                 weeks.setdefault(yw, []).append((mg, vol))
 
@@ -1116,33 +1250,26 @@ class MessageHandler:
     async def _handle_list_workouts(self, user_id: int) -> str:
         """Show last 10 workouts with batch IDs for use with delete."""
         async with db_manager.get_session() as session:
-            all_sets = await workout_set_repo.get_latest_batches(session, user_id, limit=10)
-
-            if not all_sets:
-                return "No workouts logged yet."
-
-            # Group by batch_id (already ordered by batch_id desc)
-            batches: OrderedDict[int, list] = OrderedDict()
-            for s in all_sets:
-                batches.setdefault(s.batch_id, []).append(s)
+            rows = await workout_set_repo.get_batch_summaries(session, user_id, limit=10)
 
-            lines: list[str] = []
-            for batch_id, sets in batches.items():
-                date_str = sets[0].set_date.strftime("%b %-d")
+        if not rows:
+            return "No workouts logged yet."
 
-                # Collect unique exercise names preserving order
-                ex_names: list[str] = []
-                for s in sets:
-                    name = s.exercise.name if s.exercise else f"exercise #{s.exercise_id}"
-                    if name not in ex_names:
-                        ex_names.append(name)
+        # One row per (batch, exercise), already ordered batch_id desc
+        batches: dict[int, tuple] = {}
+        for batch_id, set_date, exercise_id, name, count in rows:
+            date, names, n = batches.get(batch_id, (set_date, [], 0))
+            names.append(name or f"exercise #{exercise_id}")
+            batches[batch_id] = (date, names, n + count)
 
-                n = len(sets)
-                set_word = "set" if n == 1 else "sets"
-                ex_str = ", ".join(ex_names) if ex_names else "no exercises"
-                lines.append(f"#{batch_id}  {date_str}  {ex_str} ({n} {set_word})")
+        lines: list[str] = []
+        for batch_id, (set_date, ex_names, n) in batches.items():
+            date_str = set_date.strftime("%b %-d")
+            set_word = "set" if n == 1 else "sets"
+            ex_str = ", ".join(ex_names) if ex_names else "no exercises"
+            lines.append(f"#{batch_id}  {date_str}  {ex_str} ({n} {set_word})")
 
-            return "\n".join(lines)
+        return "\n".join(lines)
 
     async def _handle_log_weight(
         self, message: str, user_id: int, user_tz: str = "America/New_York"
@@ -1162,10 +1289,11 @@ class MessageHandler:
                 f"if that really is your body weight, say 'body weight {data.weight:g} {data.unit}'."
             )
 
+        local_now = now_in_tz(user_tz)
         if data.date:
-            recorded_at = datetime.combine(data.date, now_in_tz(user_tz).time())
+            recorded_at = datetime.combine(data.date, local_now.time())
         else:
-            recorded_at = now_in_tz(user_tz)
+            recorded_at = local_now
 
         async with db_manager.get_session() as session:
             previous = await body_weight_repo.get_latest(session, user_id)
@@ -1187,7 +1315,7 @@ class MessageHandler:
         if data.notes:
             parts[0] = f"Logged {w_str} ({data.notes})."
 
-        if data.date and data.date != now_in_tz(user_tz).date():
+        if data.date and data.date != local_now.date():
             date_label = data.date.strftime("%b %-d")
             parts[0] = parts[0].rstrip(".") + f" for {date_label}."
 
@@ -1263,4 +1391,6 @@ class MessageHandler:
             context = await build_coaching_context(
                 session, intent, message, user_id, user_tz
             )
-            return await self._llm.generate_coaching_response(message, context)
+        # Generate outside the session so the pooled connection isn't held for
+        # the length of the completion.
+        return await self._llm.generate_coaching_response(message, context)
@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
-from ..config import config
+from ..config import get_config
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +28,15 @@ class DatabaseManager:
         if self._engine is not None:
             return
 
+        cfg = get_config()
         self._engine = create_async_engine(
-            config.database.url,
-            pool_size=config.database.pool_size,
-            max_overflow=config.database.max_overflow,
-            pool_timeout=config.database.pool_timeout,
-            echo=config.debug,
+            cfg.database.url,
+            pool_size=cfg.database.pool_size,
+            max_overflow=cfg.database.max_overflow,
+            pool_timeout=cfg.database.pool_timeout,
+            pool_recycle=cfg.database.pool_recycle,
+            pool_pre_ping=cfg.database.pool_pre_ping,
+            echo=cfg.debug,
         )
 
         self._sessionmaker = async_sessionmaker(
@@ -90,3 +93,19 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Convenience function to get a database session."""
     async with db_manager.get_session() as session:
         yield session
+
+
+@asynccontextmanager
+async def managed_db() -> AsyncGenerator[DatabaseManager, None]:
+    """Keep db_manager initialized for the duration of a block (e.g. a script run).
+
+    Only closes the engine on exit if this block was the one that opened it, so
+    nested uses (clear_and_reseed → create_sample_exercises) share one pool.
+    """
+    owns_engine = db_manager._engine is None
+    await db_manager.initialize()
+    try:
+        yield db_manager
+    finally:
+        if owns_engine:
+            await db_manager.close()
@@ -0,0 +1,72 @@
+"""Schema introspection helpers for the migration scripts.
+
+Migrations read a table's columns, indexes, and foreign keys from
+information_schema once, up front, and decide every DDL step locally — instead
+of running each ALTER and string-matching the "Duplicate column" /
+"Unknown column" error on re-runs.
+A completed migration is recorded in the schema_migrations table, so re-running
+it is a single lookup.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def table_columns(session: AsyncSession, table: str) -> set[str]:
+    """Names of all columns on `table` in the current database."""
+    result = await session.execute(
+        text("""
+            SELECT COLUMN_NAME FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t
+        """),
+        {"t": table},
+    )
+    return {row[0] for row in result.all()}
+
+
+async def table_indexes(session: AsyncSession, table: str) -> set[str]:
+    """Names of all indexes on `table` in the current database."""
+    result = await session.execute(
+        text("""
+            SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t
+        """),
+        {"t": table},
+    )
+    return {row[0] for row in result.all()}
+
+
+async def table_foreign_keys(session: AsyncSession, table: str) -> dict[str, str]:
+    """Foreign keys on `table` in the current database, as {constraint: column}."""
+    result = await session.execute(
+        text("""
+            SELECT CONSTRAINT_NAME, COLUMN_NAME FROM information_schema.KEY_COLUMN_USAGE
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t
+              AND REFERENCED_TABLE_NAME IS NOT NULL
+        """),
+        {"t": table},
+    )
+    return {row[0]: row[1] for row in result.all()}
+
+
+async def migration_applied(session: AsyncSession, version: str) -> bool:
+    """Whether `version` is recorded in schema_migrations (creating it if absent)."""
+    await session.execute(text("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version VARCHAR(16) NOT NULL,
+            applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (version)
+        )
+    """))
+    result = await session.execute(
+        text("SELECT 1 FROM schema_migrations WHERE version = :v"), {"v": version}
+    )
+    return result.scalar() is not None
+
+
+async def record_migration(session: AsyncSession, version: str) -> None:
+    """Mark `version` as applied so later runs short-circuit."""
+    await session.execute(
+        text("INSERT IGNORE INTO schema_migrations (version) VALUES (:v)"),
+        {"v": version},
+    )
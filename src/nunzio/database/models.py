@@ -105,11 +105,14 @@ class WorkoutSet(Base):
 
     # Indexes
     __table_args__ = (
-        Index("idx_workout_sets_user_id", "user_id"),
         Index("idx_workout_sets_batch_id", "batch_id"),
         Index("idx_workout_sets_set_date", "set_date"),
         Index("idx_workout_sets_exercise", "exercise_id"),
         Index("idx_workout_sets_user_batch", "user_id", "batch_id"),
+        # Per-user date-range scans (overview, consistency) and per-exercise
+        # history ordered by date (log comments, category history).
+        Index("idx_workout_sets_user_date", "user_id", "set_date"),
+        Index("idx_workout_sets_user_exercise_date", "user_id", "exercise_id", "set_date"),
     )
 
     def __repr__(self) -> str:
@@ -1,9 +1,9 @@
 """Async repository pattern implementation for database operations."""
 
 from datetime import datetime
-from typing import Generic, List, Optional, Type, TypeVar, Union
+from typing import Generic, List, Optional, Sequence, Type, TypeVar, Union
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -59,10 +59,18 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         db_obj = self.model(**obj_data)
         session.add(db_obj)
+        # flush fills in the autoincrement id and the Python-side column defaults;
+        # no column has a server default, so a refresh() SELECT would add nothing.
         await session.flush()
-        await session.refresh(db_obj)
         return db_obj
 
+    async def bulk_create(self, session: AsyncSession, objs_in: Sequence[dict]) -> None:
+        """Insert many records in a single multi-row INSERT."""
+        if not objs_in:
+            return
+        await session.execute(insert(self.model), objs_in)
+        await session.flush()
+
     async def update(
         self,
         session: AsyncSession,
@@ -113,6 +121,42 @@ class ExerciseRepository(BaseRepository[Exercise, dict, dict]):
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_names(
+        self, session: AsyncSession, names: List[str]
+    ) -> dict[str, Exercise]:
+        """Exercises matching `names`, keyed by the lowercased *requested* name.
+
+        One IN query does the matching. The column collation is case- and
+        accent-insensitive ("cafe" = "Café"), which Python's lower() can't
+        reproduce. So a requested name that no returned row equals under lower()
+        is re-checked with get_by_name, but only when the IN query returned a
+        row, since otherwise nothing could match.
+        """
+        if not names:
+            return {}
+        stmt = select(Exercise).where(Exercise.name.in_(names))
+        result = await session.execute(stmt)
+        rows = {ex.name.lower(): ex for ex in result.scalars().all()}
+        matched: dict[str, Exercise] = {}
+        for name in names:
+            key = name.lower()
+            ex = rows.get(key)
+            if ex is None and rows:
+                ex = await self.get_by_name(session, name)
+            if ex is not None:
+                matched[key] = ex
+        return matched
+
+    async def get_names_by_ids(
+        self, session: AsyncSession, ids: Sequence[int]
+    ) -> dict[int, str]:
+        """Current name for each of `ids` that still exists, in one primary-key query."""
+        if not ids:
+            return {}
+        stmt = select(Exercise.id, Exercise.name).where(Exercise.id.in_(ids))
+        result = await session.execute(stmt)
+        return {row.id: row.name for row in result.all()}
+
     async def get_by_muscle_group(
         self, session: AsyncSession, muscle_group: str
     ) -> List[Exercise]:
@@ -161,6 +205,25 @@ class ExerciseRepository(BaseRepository[Exercise, dict, dict]):
         scored.sort(key=lambda x: x[1], reverse=True)
         return scored
 
+    async def match_or_score(
+        self, session: AsyncSession, name: str
+    ) -> tuple[Optional[Exercise], float]:
+        """Exact (case-insensitive) name match, else the best-scoring exercise.
+
+        One catalog read covers both tiers. Returns (exercise, 1.0) for an exact
+        match, (best, score) otherwise, or (None, 0.0) for an empty catalog.
+        """
+        best: Optional[Exercise] = None
+        best_score = 0.0
+        target = name.lower()
+        for ex in await self.get_all(session):
+            if ex.name.lower() == target:
+                return ex, 1.0
+            score = self.score_match(name, ex.name)
+            if best is None or score > best_score:
+                best, best_score = ex, score
+        return best, best_score
+
 
 class WorkoutSetRepository(BaseRepository[WorkoutSet, dict, dict]):
     """Repository for WorkoutSet operations."""
@@ -278,6 +341,43 @@ class WorkoutSetRepository(BaseRepository[WorkoutSet, dict, dict]):
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_batch_summaries(
+        self, session: AsyncSession, user_id: int, *, limit: int = 10
+    ) -> list:
+        """Per-exercise set counts for the N most recent batches, aggregated in SQL.
+
+        Returns (batch_id, set_date, exercise_id, exercise_name, set_count) rows,
+        batch_id desc, exercises in the order they were logged within each batch.
+        """
+        batch_sub = (
+            select(WorkoutSet.batch_id)
+            .where(WorkoutSet.user_id == user_id)
+            .group_by(WorkoutSet.batch_id)
+            .order_by(WorkoutSet.batch_id.desc())
+            .limit(limit)
+            .subquery()
+        )
+        stmt = (
+            select(
+                WorkoutSet.batch_id,
+                func.min(WorkoutSet.set_date),
+                WorkoutSet.exercise_id,
+                Exercise.name,
+                func.count(WorkoutSet.id),
+            )
+            .outerjoin(Exercise, Exercise.id == WorkoutSet.exercise_id)
+            .where(WorkoutSet.user_id == user_id)
+            .where(WorkoutSet.batch_id.in_(select(batch_sub.c.batch_id)))
+            .group_by(WorkoutSet.batch_id, WorkoutSet.exercise_id, Exercise.name)
+            .order_by(
+                WorkoutSet.batch_id.desc(),
+                func.min(WorkoutSet.set_number),
+                func.min(WorkoutSet.id),
+            )
+        )
+        result = await session.execute(stmt)
+        return list(result.fetchall())
+
     async def get_sets_for_date_range(
         self,
         session: AsyncSession,
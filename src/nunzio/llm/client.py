@@ -1,6 +1,8 @@
 """Async LLM client with Instructor integration for structured data extraction."""
 
 import logging
+import re
+from collections import OrderedDict
 from datetime import datetime
 from typing import Optional
 from zoneinfo import ZoneInfo
@@ -10,7 +12,7 @@ import instructor
 from openai import AsyncOpenAI
 from tenacity import AsyncRetrying, retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
-from ..config import config
+from ..config import get_config
 from .schemas import (
     BodyWeightData,
     EditSetData,
@@ -30,6 +32,33 @@ _RESIDENT_MODEL_ALLOWLIST: frozenset[str] = frozenset({
 })
 
 
+# Keyword fallback for when the classifier LLM is unreachable, in priority order.
+_FALLBACK_INTENTS: tuple[tuple[str, float, tuple[str, ...]], ...] = (
+    ("log_weight", 0.7, ("weigh", "weighed", "body weight", "bw")),
+    ("edit_set", 0.7, ("edit", "change", "fix", "correct", "update")),
+    ("delete_workout", 0.7, ("undo", "delete", "remove")),
+    ("repeat_last", 0.7, ("again", "repeat", "same as last", "another", "one more", "same thing")),
+    ("log_workout", 0.6, ("log", "did", "worked out", "i benched", "sets", "reps")),
+    ("list_workouts", 0.9, ("last workouts", "list workouts", "list sessions", "show sessions")),
+    ("view_stats", 0.9, ("stats", "progress", "history", "show")),
+)
+# One scan over the message instead of a substring search per keyword. The
+# lookahead tries every offset, so overlapping keywords are all seen; at any
+# one offset the alternation prefers the higher-priority intent.
+_FALLBACK_RE = re.compile(
+    "(?=(?:"
+    + "|".join(
+        f"(?P<{intent}>{'|'.join(map(re.escape, words))})"
+        for intent, _, words in _FALLBACK_INTENTS
+    )
+    + "))"
+)
+
+# Classifications are memoized per (normalized message, local date) — short
+# commands like "again", "undo" and "show my stats" repeat constantly.
+_INTENT_CACHE_SIZE = 512
+
+
 def _safe_zone(tz_name: str) -> ZoneInfo:
     """Resolve an IANA zone name, falling back to America/New_York if invalid."""
     try:
@@ -60,11 +89,12 @@ class LLMClient:
         self._instructor_tools_client: Optional[instructor.AsyncInstructor] = None
         self.model_override: str | None = None
         self._last_logged_model: str | None = None
+        self._intent_cache: OrderedDict[tuple[str, str], UserIntent] = OrderedDict()
 
     async def initialize(self) -> None:
         """Initialize the LLM client."""
         self._client = AsyncOpenAI(
-            base_url=f"{config.llm.base_url}/v1",
+            base_url=f"{get_config().llm.base_url}/v1",
             api_key="not-needed",
         )
         # Default extractions use JSON mode (some models emit multiple tool calls
@@ -99,27 +129,28 @@ class LLMClient:
 
     async def _get_active_model(self) -> str:
         """Check llama-swap /running and reuse a resident model when safe."""
+        llm = get_config().llm
         try:
             async with httpx.AsyncClient(timeout=2) as http:
-                resp = await http.get(f"{config.llm.base_url}/running")
+                resp = await http.get(f"{llm.base_url}/running")
                 resp.raise_for_status()
                 running = resp.json().get("running", [])
         except Exception as e:
             logger.warning(
                 "Could not check /running endpoint (%s); using configured model %s",
-                e, config.llm.model,
+                e, llm.model,
             )
             self.model_override = None
-            return config.llm.model
+            return llm.model
 
-        chosen, is_override = self._pick_model_from_running(running, config.llm.model)
+        chosen, is_override = self._pick_model_from_running(running, llm.model)
         self.model_override = chosen if is_override else None
 
         if chosen != self._last_logged_model:
             if is_override:
                 logger.info(
                     "Using resident model %s (override; configured %s)",
-                    chosen, config.llm.model,
+                    chosen, llm.model,
                 )
             else:
                 logger.info("Active model: %s", chosen)
@@ -141,6 +172,13 @@ class LLMClient:
         today = datetime.now(_safe_zone(user_tz))
         today_str = today.strftime("%A, %B %-d, %Y")
 
+        # Keyed on the local date too: "today"/"this week" resolve to concrete dates.
+        cache_key = (" ".join(message.lower().split()), today_str)
+        cached = self._intent_cache.get(cache_key)
+        if cached is not None:
+            self._intent_cache.move_to_end(cache_key)
+            return cached.model_copy(deep=True)
+
         prompt = f"""
         Analyze this user message and classify their primary intent:
 
@@ -194,49 +232,20 @@ class LLMClient:
                 temperature=0.1,
                 max_retries=_instructor_retries("classify_intent"),
             )
+            # Only real classifications are cached; keyword fallbacks are retried.
+            self._intent_cache[cache_key] = result.model_copy(deep=True)
+            if len(self._intent_cache) > _INTENT_CACHE_SIZE:
+                self._intent_cache.popitem(last=False)
             return result
 
         except Exception:
             logger.warning("LLM classification failed, using keyword fallback", exc_info=True)
             # Fallback classification
-            message_lower = message.lower()
-            if any(
-                word in message_lower
-                for word in ["weigh", "weighed", "body weight", "bw"]
-            ):
-                return UserIntent(intent="log_weight", confidence=0.7)
-            elif any(
-                word in message_lower
-                for word in ["edit", "change", "fix", "correct", "update"]
-            ):
-                return UserIntent(intent="edit_set", confidence=0.7)
-            elif any(
-                word in message_lower
-                for word in ["undo", "delete", "remove"]
-            ):
-                return UserIntent(intent="delete_workout", confidence=0.7)
-            elif any(
-                word in message_lower
-                for word in ["again", "repeat", "same as last", "another", "one more", "same thing"]
-            ):
-                return UserIntent(intent="repeat_last", confidence=0.7)
-            elif any(
-                word in message_lower
-                for word in ["log", "did", "worked out", "i benched", "sets", "reps"]
-            ):
-                return UserIntent(intent="log_workout", confidence=0.6)
-            elif any(
-                phrase in message_lower
-                for phrase in ["last workouts", "list workouts", "list sessions", "show sessions"]
-            ):
-                return UserIntent(intent="list_workouts", confidence=0.9)
-            elif any(
-                word in message_lower
-                for word in ["stats", "progress", "history", "show"]
-            ):
-                return UserIntent(intent="view_stats", confidence=0.9)
-            else:
-                return UserIntent(intent="coaching", confidence=0.5)
+            matched = {m.lastgroup for m in _FALLBACK_RE.finditer(message.lower())}
+            for intent, confidence, _ in _FALLBACK_INTENTS:
+                if intent in matched:
+                    return UserIntent(intent=intent, confidence=confidence)
+            return UserIntent(intent="coaching", confidence=0.5)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -40,10 +40,12 @@ async def build_coaching_context(
             matched_exercises.append(candidates[0])
 
     # 2. If muscle groups mentioned, pull exercises for those groups
+    seen_ids = {e.id for e in matched_exercises}
     for group in intent.mentioned_muscle_groups:
         group_exercises = await exercise_repo.get_by_muscle_group(session, group)
         for ex in group_exercises:
-            if ex.id not in {e.id for e in matched_exercises}:
+            if ex.id not in seen_ids:
+                seen_ids.add(ex.id)
                 matched_exercises.append(ex)
 
     # 3. Check for cardio
@@ -259,7 +261,8 @@ async def _build_lagging_groups_section(session: AsyncSession, user_id: int) ->
 
 async def _build_recent_conversation_section(session: AsyncSession, user_id: int) -> str:
     """The last few turns for continuity. The current message isn't logged yet, so
-    every row here is a prior turn."""
+    every row here is a prior turn; MessageHandler.process() waits for the user's
+    previous log write before handling a new message, so that turn is included."""
     logs = await message_log_repo.get_by_user(session, user_id, limit=4)
     if not logs:
         return ""
@@ -20,28 +20,25 @@ def compute_consistency(
     count_30d = len(dates_30)
     count_90d = len(dates_90)
 
+    # One sort serves all three metrics.
+    sorted_dates = sorted(dates_90)
+
+    # Consecutive gaps telescope: their sum is just last - first.
     avg_gap = None
     if count_90d >= 2:
-        sorted_dates = sorted(dates_90)
-        gaps = [
-            (sorted_dates[i + 1] - sorted_dates[i]).days
-            for i in range(len(sorted_dates) - 1)
-        ]
-        avg_gap = sum(gaps) / len(gaps)
+        avg_gap = (sorted_dates[-1] - sorted_dates[0]).days / (count_90d - 1)
 
     # Current streak: count consecutive days working backwards from today
     streak = 0
-    if dates_90:
-        sorted_dates = sorted(dates_90, reverse=True)
-        expected = today
-        for d in sorted_dates:
-            if d == expected:
-                streak += 1
-                expected = expected - timedelta(days=1)
-            elif d < expected:
-                break
-
-    days_since_last = (today - max(dates_90)).days if dates_90 else None
+    expected = today
+    for d in reversed(sorted_dates):
+        if d == expected:
+            streak += 1
+            expected = expected - timedelta(days=1)
+        elif d < expected:
+            break
+
+    days_since_last = (today - sorted_dates[-1]).days if sorted_dates else None
 
     return {
         "count_30d": count_30d,
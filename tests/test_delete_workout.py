@@ -2,6 +2,7 @@
 
 import pytest
 
+from nunzio import core
 from nunzio.core import MessageHandler
 
 
@@ -23,6 +24,12 @@ def test_parse_workout_id_embedded():
     assert MessageHandler._parse_workout_id("remove #7 please") == 7
 
 
+def test_undo_words_match_whole_words_only():
+    assert core._UNDO_RE.search("delete last")
+    assert core._UNDO_RE.search("undo.")
+    assert not core._UNDO_RE.search("delete #12, lastly")
+
+
 # --- DB integration tests ---
 
 @pytest.fixture
@@ -0,0 +1,38 @@
+"""Unit tests for the exercise-name cache in MessageHandler — no DB or LLM needed."""
+
+from unittest.mock import patch
+
+from nunzio import core
+from nunzio.core import MessageHandler
+
+
+def test_hit_is_case_insensitive():
+    h = MessageHandler(verbose=False)
+    h._cache_exercise("Bench Press", 3, "Bench Press")
+    assert h._cached_exercise("bench press") == (3, "Bench Press")
+
+
+def test_miss_returns_none():
+    h = MessageHandler(verbose=False)
+    assert h._cached_exercise("Squat") is None
+
+
+def test_expired_entry_is_dropped():
+    h = MessageHandler(verbose=False)
+    with patch.object(core.time, "monotonic", return_value=0.0):
+        h._cache_exercise("Squat", 7, "Squat")
+    with patch.object(core.time, "monotonic", return_value=core._EXERCISE_CACHE_TTL + 1):
+        assert h._cached_exercise("squat") is None
+    assert "squat" not in h._exercise_cache
+
+
+def test_evicts_least_recently_used():
+    h = MessageHandler(verbose=False)
+    with patch.object(core, "_EXERCISE_CACHE_SIZE", 2):
+        h._cache_exercise("Squat", 1, "Squat")
+        h._cache_exercise("Deadlift", 2, "Deadlift")
+        h._cached_exercise("squat")  # touch → Deadlift is now oldest
+        h._cache_exercise("Bench Press", 3, "Bench Press")
+    assert h._cached_exercise("deadlift") is None
+    assert h._cached_exercise("squat") == (1, "Squat")
+    assert h._cached_exercise("bench press") == (3, "Bench Press")
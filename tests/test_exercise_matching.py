@@ -1,5 +1,8 @@
 """Unit tests for exercise name scoring — no DB or LLM needed."""
 
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
 from nunzio.database.repository import ExerciseRepository
 
 
@@ -55,3 +58,42 @@ def test_empty_query():
 
 def test_empty_name():
     assert score("Bench Press", "") == 0.0
+
+
+_CATALOG = [SimpleNamespace(name="Bench Press"), SimpleNamespace(name="Dumbbell Flyes")]
+
+
+async def test_match_or_score_prefers_exact_name():
+    repo = ExerciseRepository(None)
+    with patch.object(repo, "get_all", AsyncMock(return_value=_CATALOG)):
+        ex, s = await repo.match_or_score(None, "bench press")
+    assert ex is _CATALOG[0] and s == 1.0
+
+
+async def test_match_or_score_falls_back_to_best_score():
+    repo = ExerciseRepository(None)
+    with patch.object(repo, "get_all", AsyncMock(return_value=_CATALOG)):
+        ex, s = await repo.match_or_score(None, "dumbbell fly")
+    assert ex is _CATALOG[1] and 0.3 <= s < 1.0
+
+
+def _session_returning(rows):
+    result = SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: rows))
+    return SimpleNamespace(execute=AsyncMock(return_value=result))
+
+
+async def test_get_by_names_keys_by_requested_name():
+    cafe = SimpleNamespace(name="Café Curl")
+    repo = ExerciseRepository(None)
+    # The IN query matched under the accent-insensitive collation; lower() doesn't.
+    with patch.object(repo, "get_by_name", AsyncMock(return_value=cafe)) as by_name:
+        found = await repo.get_by_names(_session_returning([cafe]), ["cafe curl"])
+    assert found == {"cafe curl": cafe}
+    by_name.assert_awaited_once()
+
+
+async def test_get_by_names_skips_recheck_when_nothing_matched():
+    repo = ExerciseRepository(None)
+    with patch.object(repo, "get_by_name", AsyncMock()) as by_name:
+        assert await repo.get_by_names(_session_returning([]), ["purple band pull"]) == {}
+    by_name.assert_not_awaited()
@@ -18,6 +18,15 @@ def test_single_entry_with_high_set_number_expands():
     assert all(s.reps == 10 and s.weight == 40.0 for s in result)
 
 
+def test_expansion_leaves_input_unchanged():
+    """The extracted ExerciseSet objects aren't rewritten — only copies are."""
+    original = _make_set(set_number=3, reps=8, weight=30.0)
+    exercises = [original]
+    result = MessageHandler._expand_sets(exercises)
+    assert exercises == [original] and original.set_number == 3
+    assert all(s is not original for s in result)
+
+
 def test_three_sets_expand():
     exercises = [_make_set(set_number=3, reps=8, weight=30.0)]
     result = MessageHandler._expand_sets(exercises)
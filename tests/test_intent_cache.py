@@ -0,0 +1,39 @@
+"""Unit tests for the classify_intent memo cache — no DB or LLM needed."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nunzio.llm.client import LLMClient
+from nunzio.llm.schemas import UserIntent
+
+
+@pytest.fixture
+def client():
+    c = LLMClient()
+    c._instructor_client = MagicMock()
+    c._instructor_client.chat.completions.create = AsyncMock(
+        return_value=UserIntent(intent="view_stats", confidence=0.9)
+    )
+    c._get_active_model = AsyncMock(return_value="qwen3.5-27b")
+    return c
+
+
+async def test_repeat_message_skips_llm(client):
+    first = await client.classify_intent("show my stats")
+    second = await client.classify_intent("  Show my   STATS ")
+    assert first.intent == second.intent == "view_stats"
+    assert client._instructor_client.chat.completions.create.await_count == 1
+
+
+async def test_cached_intent_is_a_copy(client):
+    first = await client.classify_intent("show my stats")
+    first.intent = "coaching"
+    second = await client.classify_intent("show my stats")
+    assert second.intent == "view_stats"
+
+
+async def test_fallback_is_not_cached(client):
+    client._instructor_client.chat.completions.create.side_effect = ValueError("down")
+    assert (await client.classify_intent("show my stats")).intent == "view_stats"
+    assert not client._intent_cache
@@ -0,0 +1,42 @@
+"""Unit tests for background message_log writes in MessageHandler — no DB or LLM needed."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+from nunzio import core
+from nunzio.core import MessageHandler
+
+
+@asynccontextmanager
+async def _no_db_session():
+    yield None
+
+
+async def test_next_message_waits_for_previous_log_write():
+    h = MessageHandler(verbose=False)
+    h._handle_delete_workout = AsyncMock(return_value="Deleted.")
+    release = asyncio.Event()
+    order: list[str] = []  # log writes, in completion order
+
+    async def slow_log(user_id, message, intent, response):
+        await release.wait()
+        order.append(f"logged {message}")
+
+    h._log_message = slow_log
+
+    with patch.object(core.db_manager, "get_session", _no_db_session), patch.object(
+        core.user_settings_repo, "get_timezone", AsyncMock(return_value="America/New_York")
+    ):
+        assert await h.process("undo", 1) == "Deleted."
+        second = asyncio.create_task(h.process("delete last", 1))
+        await asyncio.sleep(0)
+        assert h._handle_delete_workout.await_count == 1  # blocked on the first write
+
+        release.set()
+        assert await second == "Deleted."
+        await asyncio.gather(*h._pending_logs.values())
+
+    assert order == ["logged undo", "logged delete last"]
+    assert h._handle_delete_workout.await_count == 2
+    assert not h._pending_logs
@@ -1,8 +1,11 @@
 """Tests for stats sub-handlers — consistency computation and helpers."""
 
+from contextlib import asynccontextmanager
 from datetime import date, timedelta
 from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
+from nunzio import core
 from nunzio.core import MessageHandler
 
 
@@ -20,6 +23,29 @@ def test_is_more_request():
     assert not MessageHandler._is_more_request("")
 
 
+def test_fast_intent_bare_stats_commands():
+    for msg in ("stats", "/stats", "Show my stats", "show me stats!", "  STATS  "):
+        intent = MessageHandler._fast_intent(msg)
+        assert intent is not None, msg
+        assert intent.intent == "view_stats"
+        assert intent.stats_type == "overview"
+
+
+def test_fast_intent_bare_delete_and_repeat_commands():
+    for msg in ("undo", "Undo last", "delete last", "delete #42", "remove workout 7!"):
+        assert MessageHandler._fast_intent(msg).intent == "delete_workout", msg
+    for msg in ("again", "Again!", "repeat", "repeat last"):
+        assert MessageHandler._fast_intent(msg).intent == "repeat_last", msg
+
+
+def test_fast_intent_defers_to_llm_otherwise():
+    assert MessageHandler._fast_intent("show my stats for today") is None
+    assert MessageHandler._fast_intent("bench press stats") is None
+    assert MessageHandler._fast_intent("more") is None
+    assert MessageHandler._fast_intent("again at 40 lbs") is None
+    assert MessageHandler._fast_intent("delete the bench press from yesterday") is None
+
+
 def test_resolve_muscle_group_from_exercise_word():
     intent = SimpleNamespace(mentioned_muscle_groups=[], mentioned_exercises=["aerobic"])
     assert MessageHandler._resolve_muscle_group(intent) == "cardio"
@@ -96,3 +122,50 @@ def test_consistency_30_vs_90_split():
     result = MessageHandler._compute_consistency(dates_90, dates_30)
     assert result["count_30d"] == len(dates_30)
     assert result["count_90d"] == 9
+
+
+@asynccontextmanager
+async def _no_db_session():
+    yield None
+
+
+async def test_stats_views_are_cached_until_a_write():
+    h = MessageHandler(verbose=False)
+    h._handle_prs = AsyncMock(return_value="PRs")
+    h._handle_delete_workout = AsyncMock(return_value="Deleted.")
+    h._log_message = AsyncMock()
+    intent = SimpleNamespace(stats_type="prs", mentioned_exercises=[], mentioned_muscle_groups=[])
+
+    assert await h._handle_view_stats(intent, 1) == "PRs"
+    assert await h._handle_view_stats(intent, 1) == "PRs"
+    assert h._handle_prs.await_count == 1
+
+    # A write intent routed through process() drops the user's cached views.
+    with patch.object(core.db_manager, "get_session", _no_db_session), patch.object(
+        core.user_settings_repo, "get_timezone", AsyncMock(return_value="America/New_York")
+    ):
+        assert await h.process("undo", 1) == "Deleted."
+    h._handle_delete_workout.assert_awaited_once()
+
+    await h._handle_view_stats(intent, 1)
+    assert h._handle_prs.await_count == 2
+
+
+async def test_stats_cache_drops_expired_and_caps_per_user():
+    h = MessageHandler(verbose=False)
+    h._handle_exercise_history = AsyncMock(return_value="history")
+
+    def _intent(name):
+        return SimpleNamespace(
+            stats_type="exercise_history", mentioned_exercises=[name], mentioned_muscle_groups=[]
+        )
+
+    with patch.object(core.time, "monotonic", return_value=0.0):
+        await h._handle_view_stats(_intent("squat"), 1)
+    with patch.object(core.time, "monotonic", return_value=core._STATS_CACHE_TTL + 1):
+        await h._handle_view_stats(_intent("bench"), 1)
+    assert [k[2] for k in h._stats_cache[1]] == [("bench",)]
+
+    for i in range(core._STATS_CACHE_SIZE + 5):
+        await h._handle_view_stats(_intent(f"ex {i}"), 1)
+    assert len(h._stats_cache[1]) == core._STATS_CACHE_SIZE